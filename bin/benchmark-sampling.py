@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# measures the cost of reading all sources of the sampling hub once
+# through psutil and through the native /proc reader
+import sys
+import timeit
+from permon.backend import sampling, procfs
+
+N_SAMPLES = 2000
+SOURCES = ['cpu_percent', 'memory', 'disk_io']
+
+
+def benchmark(hub):
+    def sample():
+        with hub.tick():
+            for source in SOURCES:
+                hub.get(source)
+
+    # warm up caches and the cpu_percent state
+    sample()
+    seconds = min(timeit.repeat(sample, number=N_SAMPLES, repeat=3))
+    return seconds / N_SAMPLES * 1e6
+
+
+def main():
+    backends = [('psutil', sampling.register_psutil_sources)]
+    if procfs.is_available():
+        backends.append(('procfs', sampling.register_procfs_sources))
+    else:
+        print('/proc reader is not available on this system.',
+              file=sys.stderr)
+
+    results = {}
+    for name, register in backends:
+        hub = sampling.SamplingHub()
+        register(hub)
+        results[name] = benchmark(hub)
+        print(f'{name:>8}: {results[name]:8.1f} µs per sample')
+
+    if len(results) == 2:
+        speedup = results['psutil'] / results['procfs']
+        print(f'procfs is {speedup:.1f}x faster than psutil')
+
+
+if __name__ == '__main__':
+    main()
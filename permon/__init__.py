@@ -6,8 +6,9 @@ import os
 import json
 import textwrap
 import permon
-from permon.frontend import native, terminal, browser
+from permon.frontend import native, terminal, browser, record, FastScheduler
 from permon import config, backend, exceptions, security
+from permon.backend import recording, replay
 
 here = os.path.abspath(os.path.dirname(__file__))
 __version__ = open(os.path.join(here, 'VERSION')).read()
@@ -34,6 +35,10 @@ the subcommand to launch.
 
 When ``terminal``, ``browser`` or ``native``, runs the respective frontend.
 
+When ``record``, records stats to a file without any UI.
+
+When ``replay``, plays a recording back in one of the frontends.
+
 When ``config``, runs command to interact with configuration.
 
 When ``password``, runs command to set permon's password.
@@ -64,6 +69,18 @@ the path to an SSL/TLS certificate file
 the path to a private key file for usage with SSL/TLS
     """)
 
+    record_parser = subparsers.add_parser('record', help="""
+Records stats to a file without any UI, e. g. on servers.
+Stops on Ctrl+C or after ``--duration`` seconds.
+    """)
+    record_parser.add_argument('--output', '-o', type=str, required=True, help="""
+the path of the recording. Contributor names are stored next to it in
+``<output>.names``. Existing recordings are never overwritten.
+    """)
+    record_parser.add_argument('--duration', type=float, help="""
+the number of seconds to record for
+    """)
+
     # stats in the config need to be parsed to dictionaries first
     # because they can be specified by their tag name when the settings are
     # kept at their default
@@ -83,12 +100,49 @@ the frames per second the display moves with
             subparser.add_argument('--verbose', action='store_true', default=current_config['verbose'], help=f"""
 whether to enable verbose logging
             """)
+        if subparser.prog not in ('permon terminal', 'permon record'):
             # the buffer size is determined by the terminal width in the
             # terminal frontend and can thus not be set by the user
+            # recordings do not have a history
             subparser.add_argument('--buffer-size', type=int, help="""
 the number of points displayed on the screen at any time
             """)
 
+    # the replay parser is added after the common arguments because
+    # its stats are taken from the recording
+    replay_parser = subparsers.add_parser('replay', help="""
+Plays a recording made with ``permon record`` back in one of the frontends.
+    """)
+    replay_parser.add_argument('recording', type=str, help="""
+the path of the recording
+    """)
+    replay_parser.add_argument('--frontend', choices=['terminal', 'browser', 'native'], default='terminal', help="""
+the frontend to play the recording back in
+    """)
+    replay_parser.add_argument('--start', type=float, default=0., help="""
+the number of seconds after the start of the recording to start at
+    """)
+    replay_parser.add_argument('--speed', type=float, default=1., help="""
+how many times faster than real time the recording is played back
+    """)
+    replay_parser.add_argument('--fast', action='store_true', default=False, help="""
+play one recorded row per frame without waiting between frames.
+Every run shows the same frames, so this can be used to benchmark frontends.
+    """)
+    replay_parser.add_argument('--fps', type=int, help="""
+the frames per second the display moves with.
+Defaults to the frames per second of the recording.
+    """)
+    replay_parser.add_argument('--buffer-size', type=int, help="""
+the number of points displayed on the screen at any time
+    """)
+    replay_parser.add_argument('--port', type=int, default=1234, help="""
+the port the browser frontend will listen on
+    """)
+    replay_parser.add_argument('--verbose', action='store_true', default=current_config['verbose'], help=f"""
+whether to enable verbose logging
+    """)
+
     config_parser = subparsers.add_parser('config', help=f"""
 Command to interact with the configuration of permon.
 Default configuration:
@@ -111,11 +165,26 @@ for the respective stat e. g.
                 "settings": {{
                     "connection info": "",
                     "query interval [s]": 1
-                }}
+                }},
+                "sample interval [s]": 2,
+                "deadline [s]": 1
             }}
         ]
         ...
 
+The optional key ``sample interval [s]`` sets how often the stat is polled.
+Between polls, the last value is held. If it is ``null`` or not given,
+the default of the stat is used which is every frame for most stats.
+
+The optional key ``deadline [s]`` sets how long a poll of the stat may take.
+If the deadline is missed, the last value is shown and marked as stale.
+Stats missing their deadline repeatedly are polled less often and
+eventually disabled. If it is ``null`` or not given, the default of the
+stat is used which is half a frame for most stats.
+
+If the optional key ``isolated`` is ``true``, the stat runs in a separate
+process so that expensive stats do not slow down the frontend. This needs
+a system on which processes can be forked i. e. not Windows.
     """)
     config_parser.add_argument('command', choices=['edit', 'show', 'reset'], help=f"""
 Which command to run.
@@ -161,13 +230,28 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    # get the stat classes from the dictionaries representing stats
-    stats = backend.get_stats_from_repr(args.stats)
+    if args.subcommand == 'replay':
+        # the stats of a replay read their values from the recording
+        try:
+            session = replay.ReplaySession(
+                recording.RecordingReader(args.recording),
+                start=args.start, speed=args.speed, fast=args.fast)
+        except (OSError, ValueError) as e:
+            logging.error(f'Replaying {args.recording} failed: {str(e)}')
+            sys.exit(1)
+        stats = session.stats
+        frontend = args.frontend
+        fps = args.fps or session.reader.header['fps']
+    else:
+        # get the stat classes from the dictionaries representing stats
+        stats = backend.get_stats_from_repr(args.stats)
+        frontend = args.subcommand
+        fps = args.fps
 
     # determines which colors are used in frontends that support custom colors
     colors = current_config['colors']
 
-    verbose = 0 if args.subcommand == 'terminal' else args.verbose
+    verbose = 0 if frontend == 'terminal' else args.verbose
     logging_level = logging.INFO if verbose else logging.WARNING
     logging.basicConfig(format='%(asctime)s \t %(message)s',
                         datefmt='%d-%m-%Y %I:%M:%S %p',
@@ -177,7 +261,12 @@ def main():
     # specified by the user
     # instantiating the app only sets some values
     # the actual UI is launched in app.initialize
-    if args.subcommand == 'browser':
+    if args.subcommand == 'replay' and frontend == 'browser':
+        app = browser.BrowserApp(stats, colors=colors,
+                                 buffer_size=args.buffer_size, fps=fps,
+                                 port=args.port, ip='localhost',
+                                 open_browser=True)
+    elif args.subcommand == 'browser':
         # set the ssl context if a certfile and keyfile are given for https
         ssl_context = None
         if args.certfile and args.keyfile:
@@ -192,11 +281,20 @@ def main():
                                  port=args.port, ip=args.ip,
                                  open_browser=not args.no_browser,
                                  ssl_context=ssl_context)
-    elif args.subcommand == 'native':
+    elif frontend == 'native':
         app = native.NativeApp(stats, colors=colors,
-                               buffer_size=args.buffer_size, fps=args.fps)
-    elif args.subcommand == 'terminal':
-        app = terminal.TerminalApp(stats, fps=args.fps)
+                               buffer_size=args.buffer_size, fps=fps)
+    elif frontend == 'terminal':
+        app = terminal.TerminalApp(stats, fps=fps)
+    elif args.subcommand == 'record':
+        if os.path.exists(args.output):
+            logging.error(f'{args.output} already exists.')
+            sys.exit(1)
+        app = record.RecordApp(stats, path=args.output, fps=args.fps,
+                               duration=args.duration)
+
+    if args.subcommand == 'replay' and args.fast:
+        app.scheduler = FastScheduler(app.fps)
 
     # app.make_available checks if the app is available
     # i. e. all needed modules are installed and prompts the user to
@@ -205,7 +303,7 @@ def main():
         app.make_available()
     except exceptions.FrontendNotAvailableError as e:
         logging.error(
-            f'frontend "{args.subcommand}" is not available. Reason: {str(e)}')
+            f'frontend "{frontend}" is not available. Reason: {str(e)}')
         sys.exit(1)
 
     app.initialize()
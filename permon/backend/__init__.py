@@ -2,7 +2,14 @@ import os
 from abc import ABC, ABCMeta, abstractmethod
 import glob
 import runpy
+from collections import namedtuple
+import numpy as np
 from permon import exceptions, config
+from permon.backend.rate import CounterRate
+
+# a sample of a stat as it is handed to the frontends. contributors is a
+# list of (name, value) tuples which is empty if the stat has no breakdown
+Sample = namedtuple('Sample', ['value', 'contributors'])
 
 
 class MetaStat(ABCMeta):
@@ -26,11 +33,24 @@ class Stat(ABC, metaclass=MetaStat):
     """
     _initialized = False
     default_settings = {}
+    # whether get_stat returns a tuple of the value and a list of
+    # (name, value) tuples of contributors instead of only the value
+    has_contributor_breakdown = False
+    # whether the samples of the stat are arrays, see `VectorStat`
+    is_vector = False
+    # the interval in seconds the stat is polled in
+    # if None, the stat is polled every frame
+    default_sample_interval = None
+    # the time in seconds a call to get_stat may take before the last
+    # value is used instead. if None, it is half a frame
+    default_deadline = None
+    # whether the stat runs in a worker process so that it can not take
+    # time away from the frontend. needs the fork start method
+    default_isolated = False
 
     def __init__(self, fps):
         """
         Construct a stat.
-        self.get_stat must already work when this is called.
         """
         if not self._initialized:
             raise exceptions.InvalidStatError(
@@ -42,9 +62,17 @@ class Stat(ABC, metaclass=MetaStat):
             raise exceptions.InvalidStatError(
                 'Unavailable stats can not be instantiated.')
         self.fps = fps
-        # check if the class returns a tuple. in that case, it contains a
-        # breakdown of contributors to the stat
-        self.has_contributor_breakdown = isinstance(self.get_stat(), tuple)
+
+    @classmethod
+    def make_sample(cls, result):
+        """Get a `Sample` from a result of `get_stat`."""
+        if cls.has_contributor_breakdown:
+            return Sample(*result)
+        return Sample(result, [])
+
+    def empty_sample(self):
+        """Get the sample shown before the stat has returned a value."""
+        return Sample(self.minimum or 0., [])
 
     @classmethod
     def _init_tags(cls):
@@ -74,6 +102,9 @@ class Stat(ABC, metaclass=MetaStat):
             cls.root_tag = root_tag
             cls.tag = f'{cls.root_tag}.{cls.base_tag}'
             cls.settings = cls.default_settings.copy()
+            cls.sample_interval = cls.default_sample_interval
+            cls.deadline = cls.default_deadline
+            cls.isolated = cls.default_isolated
 
             cls._initialized = True
 
@@ -104,6 +135,61 @@ class Stat(ABC, metaclass=MetaStat):
             # specified in the default settings
             cls.settings[key] = key_type(value)
 
+    @classmethod
+    def set_sample_interval(cls, interval):
+        """
+        Set the interval in seconds the stat is polled in.
+        Between polls, frontends hold the last value of the stat.
+        If `interval` is None, the default sample interval is used.
+        """
+        if interval is None:
+            cls.sample_interval = cls.default_sample_interval
+        else:
+            cls.sample_interval = float(interval)
+
+    @classmethod
+    def set_deadline(cls, deadline):
+        """
+        Set the time in seconds a call to `get_stat` may take.
+        If `deadline` is None, the default deadline is used.
+        A deadline of None means half a frame.
+        """
+        if deadline is None:
+            cls.deadline = cls.default_deadline
+        else:
+            cls.deadline = float(deadline)
+
+    @classmethod
+    def set_isolated(cls, isolated):
+        """
+        Set whether the stat runs in a worker process.
+        If `isolated` is None, the default is used.
+        """
+        if isolated is None:
+            cls.isolated = cls.default_isolated
+        else:
+            cls.isolated = bool(isolated)
+
+    @classmethod
+    def get_repr(cls):
+        """
+        Get the representation of the stat in the config. That is the tag
+        if nothing is changed from the defaults and a dictionary otherwise.
+        """
+        if cls.settings == cls.default_settings and \
+                cls.sample_interval == cls.default_sample_interval and \
+                cls.deadline == cls.default_deadline and \
+                cls.isolated == cls.default_isolated:
+            return cls.tag
+
+        return {
+            'tag': cls.tag,
+            'settings': cls.settings,
+            'sample interval [s]': cls.sample_interval,
+            'deadline [s]': cls.deadline,
+            'isolated': cls.isolated
+        }
+
     @classmethod
     def check_availability(cls):
         """
@@ -113,11 +199,30 @@ class Stat(ABC, metaclass=MetaStat):
         """
         pass
 
+    def start(self):
+        """
+        Start the threads or subprocesses the stat needs.
+        Called by the frontend once before the stat is polled.
+        See `permon.backend.lifecycle.BackgroundThread` for a thread
+        which can be stopped without waiting for it indefinitely.
+        """
+        pass
+
+    def stop(self):
+        """
+        Stop everything started in `start`.
+        Called by the frontend when the stat is removed or permon quits.
+        This must not block for more than about a second.
+        """
+        pass
+
     @abstractmethod
     def get_stat(self):
         """
         Get the current value of the stat.
-        This must be defined by the stat creator.
+        This must be defined by the stat creator. Stats waiting for I/O
+        can define it with `async def`, all async stats then run
+        concurrently on one event loop.
         """
         pass
 
@@ -140,6 +245,64 @@ class Stat(ABC, metaclass=MetaStat):
         pass
 
 
+class VectorStat(Stat, ABC):
+    """
+    Base class for stats with multiple values per sample, e. g. the usage
+    of every core. `get_stat` returns a sequence of numbers with one
+    number for every element of `labels`. Samples and the history of
+    frontends store them as NumPy arrays.
+    Vector stats have no contributor breakdown. `minimum` and `maximum`
+    apply to every element.
+    """
+    is_vector = True
+
+    @classmethod
+    def _validate_stat(cls):
+        super(VectorStat, cls)._validate_stat()
+        if not hasattr(cls, 'labels'):
+            raise exceptions.InvalidStatError(
+                'Vector stats must have a static labels attribute.')
+
+    @classmethod
+    def make_sample(cls, result):
+        return Sample(np.asarray(result, dtype=float), [])
+
+    def empty_sample(self):
+        return Sample(np.full(len(self.labels), float(self.minimum or 0.)),
+                      [])
+
+
+class CounterStat(Stat, ABC):
+    """
+    Base class for stats showing the rate per second of a counter which
+    only ever increases, e. g. the bytes read from disk since boot.
+    Subclasses implement `read_counter` instead of `get_stat`. The rate
+    is multiplied with `scale` to convert it to the unit of the stat.
+    The ``window [s]`` setting is the time the rate is averaged over.
+    """
+    default_settings = {
+        'window [s]': 1.
+    }
+    scale = 1.
+
+    def __init__(self, fps):
+        super(CounterStat, self).__init__(fps=fps)
+        self.rate = CounterRate(window=self.settings['window [s]'])
+
+    @abstractmethod
+    def read_counter(self):
+        """Get the current value of the counter."""
+        pass
+
+    def get_stat(self):
+        # imported here to avoid a circular import
+        from permon.backend import sampling
+
+        rate = self.rate.update(self.read_counter(),
+                                sampling.hub.timestamp())
+        return rate * self.scale
+
+
 def _import_all_stats():
     """
     Import all stats (prepackaged ones and user defined ones).
@@ -196,8 +359,13 @@ def get_stats_from_repr(stat_repr):
     for stat in get_all_stats():
         try:
             index = tags.index(stat.tag)
-            stat.check_availability()
+            # the availability of a stat can depend on its settings
             stat.set_settings(stat_dicts[index]['settings'])
+            stat.check_availability()
+            stat.set_sample_interval(
+                stat_dicts[index]['sample interval [s]'])
+            stat.set_deadline(stat_dicts[index]['deadline [s]'])
+            stat.set_isolated(stat_dicts[index]['isolated'])
 
             stats.append(stat)
         except ValueError:
@@ -0,0 +1,52 @@
+import os
+import asyncio
+import inspect
+import threading
+
+# the event loop all async stats run on. it is started on first use
+_loop = None
+_lock = threading.Lock()
+
+
+def is_async(function):
+    """Check if `function` must be awaited i. e. is defined with async def."""
+    return inspect.iscoroutinefunction(function)
+
+
+def get_loop():
+    """
+    Get the event loop async stats run on.
+    The loop runs forever in a daemon thread.
+    """
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_loop.run_forever,
+                                      name='permon-asyncio', daemon=True)
+            thread.start()
+        return _loop
+
+
+def _reset():
+    # the thread running the loop does not exist in a forked process
+    global _loop, _lock
+    _loop = None
+    _lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset)
+
+
+def submit(function):
+    """
+    Schedule the coroutine function `function` on the event loop.
+    Returns a `concurrent.futures.Future` of its result.
+    """
+    return asyncio.run_coroutine_threadsafe(function(), get_loop())
+
+
+def run(function):
+    """Run the coroutine function `function` and wait for its result."""
+    return submit(function).result()
@@ -0,0 +1,109 @@
+import os
+from permon.backend.procfs import ProcFile
+
+# the mount point of the unified cgroup v2 hierarchy
+CGROUP_ROOT = '/sys/fs/cgroup'
+
+
+def is_available(root=CGROUP_ROOT):
+    """
+    Check if the cgroup reader can be used.
+    It needs the cgroup v2 hierarchy and `os.preadv`.
+    """
+    if not hasattr(os, 'preadv'):
+        return False
+    # only the root of a cgroup v2 hierarchy has this file
+    return os.access(os.path.join(root, 'cgroup.controllers'), os.R_OK)
+
+
+class CgroupReader():
+    """
+    Reads the CPU and memory usage of every leaf cgroup in the cgroup v2
+    hierarchy. Processes only live in leaf cgroups, e. g. systemd services
+    or containers. The files of every cgroup are kept open between reads.
+    """
+    def __init__(self, root=CGROUP_ROOT):
+        self.root = root
+        # maps paths of cgroups to their cpu.stat and memory.current file
+        # memory.current is None if the memory controller is not enabled
+        self._files = {}
+        # maps paths of cgroups to their CPU usage in microseconds and
+        # the time it has been read at
+        self._previous_usage = {}
+
+    def _find_leaves(self):
+        """Get the paths of all cgroups without child cgroups."""
+        leaves = []
+        stack = [self.root]
+        while stack:
+            path = stack.pop()
+            try:
+                children = [entry.path for entry in os.scandir(path)
+                            if entry.is_dir(follow_symlinks=False)]
+            except OSError:
+                # the cgroup has been removed in the meantime
+                continue
+
+            if children:
+                stack.extend(children)
+            elif path != self.root:
+                leaves.append(path)
+        return leaves
+
+    def _open(self, path):
+        memory_path = os.path.join(path, 'memory.current')
+        files = (
+            ProcFile(os.path.join(path, 'cpu.stat')),
+            ProcFile(memory_path) if os.access(memory_path, os.R_OK)
+            else None
+        )
+        self._files[path] = files
+        return files
+
+    def _close(self, path):
+        for file in self._files.pop(path):
+            if file is not None:
+                file.close()
+        self._previous_usage.pop(path, None)
+
+    def read(self, timestamp):
+        """
+        Get a dictionary mapping the names of all leaf cgroups to their
+        CPU usage in percent of one core since the previous read and
+        their memory usage in bytes. `timestamp` is the monotonic time
+        of the read.
+        """
+        leaves = self._find_leaves()
+        for path in self._files.keys() - set(leaves):
+            self._close(path)
+
+        usage = {}
+        for path in leaves:
+            try:
+                cpu_file, memory_file = self._files.get(path) or \
+                    self._open(path)
+                # the first line of cpu.stat is the total usage
+                cpu_usage = int(cpu_file.read().split(b'\n', 1)[0].split()[1])
+                memory = int(memory_file.read()) if memory_file else 0
+            except OSError:
+                # the cgroup has been removed in the meantime
+                if path in self._files:
+                    self._close(path)
+                continue
+
+            cpu_percent = 0.
+            if path in self._previous_usage:
+                previous_usage, previous_timestamp = \
+                    self._previous_usage[path]
+                if timestamp > previous_timestamp:
+                    cpu_percent = (cpu_usage - previous_usage) / 1e6 / \
+                        (timestamp - previous_timestamp) * 100
+            self._previous_usage[path] = (cpu_usage, timestamp)
+
+            name = os.path.relpath(path, self.root)
+            usage[name] = {'cpu': max(cpu_percent, 0.), 'ram': memory}
+        return usage
+
+    def close(self):
+        for path in list(self._files):
+            self._close(path)
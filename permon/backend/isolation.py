@@ -0,0 +1,195 @@
+import os
+import sys
+import json
+import time
+import struct
+import signal
+import logging
+import multiprocessing
+from multiprocessing import shared_memory
+from permon.backend import aio
+
+# the ring starts with the number of samples written so far
+_HEADER = struct.Struct('<Q')
+# every slot starts with a sequence number which is odd while the slot is
+# written, and the length of the payload
+_SLOT_HEADER = struct.Struct('<QI')
+
+
+def is_available():
+    """
+    Check if stats can be run in a worker process.
+    Stat classes are loaded from files with runpy, so they can not be
+    pickled and the worker must be forked from the permon process.
+    """
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+class SharedRing():
+    """
+    A ring of slots in shared memory written by one process and read by
+    others. Every slot holds the JSON encoded sample of a stat. Readers
+    only ever read the latest slot and never wait for the writer, a read
+    racing with a write is retried.
+    """
+    def __init__(self, n_slots=4, slot_size=4096):
+        self.n_slots = n_slots
+        self.slot_size = slot_size
+        size = _HEADER.size + n_slots * slot_size
+        self._memory = shared_memory.SharedMemory(create=True, size=size)
+        self._memory.buf[:size] = bytes(size)
+
+    def _slot_offset(self, index):
+        return _HEADER.size + (index % self.n_slots) * self.slot_size
+
+    def write(self, sample):
+        """Write `sample` to the next slot and publish it."""
+        # numpy scalars are converted to floats
+        payload = json.dumps(sample, default=float).encode()
+        max_payload_size = self.slot_size - _SLOT_HEADER.size
+        if len(payload) > max_payload_size:
+            raise ValueError(f'Sample of {len(payload)} bytes does not fit '
+                             f'into a slot of {max_payload_size} bytes.')
+
+        buf = self._memory.buf
+        count = _HEADER.unpack_from(buf, 0)[0]
+        offset = self._slot_offset(count)
+        sequence = _SLOT_HEADER.unpack_from(buf, offset)[0]
+
+        _SLOT_HEADER.pack_into(buf, offset, sequence + 1, len(payload))
+        start = offset + _SLOT_HEADER.size
+        buf[start:start + len(payload)] = payload
+        _SLOT_HEADER.pack_into(buf, offset, sequence + 2, len(payload))
+        _HEADER.pack_into(buf, 0, count + 1)
+
+    def read_latest(self):
+        """Get the latest sample or None if nothing has been written yet."""
+        buf = self._memory.buf
+        while True:
+            count = _HEADER.unpack_from(buf, 0)[0]
+            if count == 0:
+                return None
+
+            offset = self._slot_offset(count - 1)
+            sequence, length = _SLOT_HEADER.unpack_from(buf, offset)
+            start = offset + _SLOT_HEADER.size
+            payload = bytes(buf[start:start + length])
+            # the slot has been written to while it was read
+            if sequence % 2 == 1 or \
+                    _SLOT_HEADER.unpack_from(buf, offset)[0] != sequence:
+                continue
+            return json.loads(payload)
+
+    def close(self, unlink=True):
+        self._memory.close()
+        if unlink:
+            self._memory.unlink()
+
+
+def _run_worker(stat_class, fps, ring, stop_event):
+    """Sample `stat_class` and write to `ring` until `stop_event` is set."""
+    # the permon process handles interrupts and stops the worker
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    stat = stat_class(fps=fps)
+    stat.start()
+    interval = stat.sample_interval or 1 / fps
+    parent_pid = os.getppid()
+
+    try:
+        while not stop_event.is_set() and os.getppid() == parent_pid:
+            start = time.monotonic()
+            if aio.is_async(stat.get_stat):
+                result = aio.run(stat.get_stat)
+            else:
+                result = stat.get_stat()
+
+            sample = stat.make_sample(result)
+            value = sample.value.tolist() if stat.is_vector else sample.value
+            ring.write([value, sample.contributors,
+                        stat.minimum, stat.maximum])
+
+            stop_event.wait(max(interval - (time.monotonic() - start), 0))
+    finally:
+        stat.stop()
+
+
+class ProcessStat():
+    """
+    Runs a stat in a worker process and reads its latest sample from a
+    `SharedRing`. Calling `get_stat` never blocks on the worker, it
+    returns whatever sample has been published last.
+    The worker is started by `start` and stopped by `stop` like the
+    threads of a regular stat.
+    All other attributes are taken from the stat class.
+    """
+    def __init__(self, stat_class, fps, start_timeout=5.):
+        self.stat_class = stat_class
+        self.fps = fps
+        self.start_timeout = start_timeout
+        self.ring = SharedRing()
+        self._stopped = False
+
+        context = multiprocessing.get_context('fork')
+        self._stop_event = context.Event()
+        self._process = context.Process(
+            target=_run_worker,
+            args=(stat_class, fps, self.ring, self._stop_event),
+            name=f'permon-{stat_class.tag}', daemon=True)
+
+    def start(self):
+        # the worker writes its output to the same terminal, flush first
+        # so buffered output is not written twice
+        sys.stdout.flush()
+        self._process.start()
+
+        # wait for the first sample to know minimum and maximum
+        deadline = time.monotonic() + self.start_timeout
+        self._latest = self.ring.read_latest()
+        while self._latest is None:
+            if not self._process.is_alive() or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError(
+                    f'Worker process of {self.stat_class.tag} did not start.')
+            time.sleep(.01)
+            self._latest = self.ring.read_latest()
+
+    def __getattr__(self, name):
+        return getattr(self.stat_class, name)
+
+    def get_stat(self):
+        sample = self.ring.read_latest()
+        if sample is not None:
+            self._latest = sample
+
+        value, contributors = self._latest[:2]
+        if self.has_contributor_breakdown:
+            return value, [tuple(x) for x in contributors]
+        return value
+
+    def empty_sample(self):
+        return self.stat_class.empty_sample(self)
+
+    @property
+    def minimum(self):
+        return self._latest[2]
+
+    @property
+    def maximum(self):
+        return self._latest[3]
+
+    def stop(self):
+        """Stop the worker process and free the shared memory."""
+        if self._stopped:
+            return
+        self._stopped = True
+
+        if self._process.is_alive():
+            self._stop_event.set()
+            self._process.join(timeout=1.)
+            if self._process.is_alive():
+                logging.warning(f'Worker process of {self.stat_class.tag} '
+                                'did not stop, terminating it.')
+                self._process.terminate()
+                self._process.join()
+        self.ring.close()
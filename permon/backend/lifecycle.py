@@ -0,0 +1,37 @@
+import logging
+import threading
+
+
+class BackgroundThread():
+    """
+    A thread owned by a stat, started in `Stat.start` and stopped in
+    `Stat.stop`. `target` is called with a `threading.Event` which is set
+    once the thread should stop, so it can wait on the event instead of
+    sleeping. The thread is a daemon and never keeps the interpreter alive.
+    """
+    def __init__(self, target, name):
+        self.name = name
+        self.stop_event = threading.Event()
+        self._thread = threading.Thread(target=target,
+                                        args=(self.stop_event,),
+                                        name=name, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def stop(self, timeout=1.):
+        """
+        Ask the thread to stop and wait at most `timeout` seconds for it.
+        Returns whether the thread has stopped.
+        """
+        self.stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        if self._thread.is_alive():
+            logging.warning(f'Thread {self.name} did not stop '
+                            f'within {timeout}s.')
+            return False
+        return True
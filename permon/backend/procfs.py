@@ -0,0 +1,180 @@
+import os
+
+# the files needed to read all sources of the sampling hub
+STAT_PATH = '/proc/stat'
+MEMINFO_PATH = '/proc/meminfo'
+DISKSTATS_PATH = '/proc/diskstats'
+
+# /proc/diskstats always counts in sectors of 512 bytes,
+# independent of the actual sector size of the device
+SECTOR_SIZE = 512
+
+
+def is_pss_available():
+    """
+    Check if the proportional set size of processes can be read.
+    It needs /proc/<pid>/smaps_rollup which exists since Linux 4.14.
+    """
+    return os.access('/proc/self/smaps_rollup', os.R_OK)
+
+
+def read_pss(pid):
+    """
+    Get the proportional set size of the process with `pid` in bytes,
+    i. e. its resident memory with shared pages divided among all
+    processes sharing them. Raises an `OSError` if it can not be read.
+    """
+    with open(f'/proc/{pid}/smaps_rollup', 'rb') as f:
+        for line in f:
+            if line.startswith(b'Pss:'):
+                return int(line.split()[1]) * 1024
+    raise OSError(f'smaps_rollup of process {pid} has no Pss field.')
+
+
+def is_available():
+    """
+    Check if the /proc reader can be used.
+    It needs a Linux /proc filesystem and `os.preadv`.
+    """
+    if not hasattr(os, 'preadv'):
+        return False
+    paths = [STAT_PATH, MEMINFO_PATH, DISKSTATS_PATH]
+    return all(os.access(path, os.R_OK) for path in paths)
+
+
+class ProcFile():
+    """
+    A file in /proc which is kept open for its whole lifetime.
+    Every read regenerates the file contents by reading from offset 0
+    into a buffer which is reused between reads.
+    """
+    def __init__(self, path, buffer_size=4096):
+        self.path = path
+        self._fd = None
+        self._fd = os.open(path, os.O_RDONLY)
+        self._buffer = bytearray(buffer_size)
+
+    def read(self):
+        """Read the current contents of the file."""
+        while True:
+            n_bytes = os.preadv(self._fd, [self._buffer], 0)
+            # if the buffer is full, the read might have been cut short
+            # so grow the buffer and read again
+            if n_bytes < len(self._buffer):
+                return bytes(memoryview(self._buffer)[:n_bytes])
+            self._buffer = bytearray(len(self._buffer) * 2)
+
+    def close(self):
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                # the descriptor is already unusable
+                pass
+
+    def __del__(self):
+        self.close()
+
+
+class ProcReader():
+    """
+    Reads the sources of the sampling hub directly from /proc.
+    Only the fields needed by the core stats are parsed. The values
+    returned have the same meaning as the ones returned by psutil.
+    """
+    def __init__(self):
+        self._stat_file = ProcFile(STAT_PATH)
+        self._meminfo_file = ProcFile(MEMINFO_PATH)
+        self._diskstats_file = ProcFile(DISKSTATS_PATH)
+        # maps device names to whether they are a whole disk
+        # and not a partition
+        self._storage_devices = {}
+        # busy and total time of every core at the previous read
+        self._previous_cpu_times = self._read_cpu_times()
+
+    def _read_cpu_times(self):
+        """Get a list of (busy, total) times in jiffies for every core."""
+        cpu_times = []
+        for line in self._stat_file.read().split(b'\n'):
+            if not line.startswith(b'cpu'):
+                # the cpu lines are always at the top of the file
+                if cpu_times:
+                    break
+                continue
+            # skip the line aggregating all cores
+            if line[3:4] == b' ':
+                continue
+
+            # user, nice, system, idle, iowait, irq, softirq, steal
+            # guest time is already accounted for in user and nice
+            times = [int(x) for x in line.split()[1:9]]
+            total = sum(times)
+            busy = total - times[3] - times[4]
+            cpu_times.append((busy, total))
+        return cpu_times
+
+    def read_cpu_percent(self):
+        """
+        Get the usage in percent of every core since the previous call.
+        Equivalent to `psutil.cpu_percent(percpu=True)`.
+        """
+        cpu_times = self._read_cpu_times()
+
+        percentages = []
+        for (busy, total), (prev_busy, prev_total) in zip(
+                cpu_times, self._previous_cpu_times):
+            total_delta = total - prev_total
+            if total_delta <= 0:
+                percentages.append(0.)
+                continue
+            percent = (busy - prev_busy) / total_delta * 100
+            percentages.append(min(max(percent, 0.), 100.))
+
+        self._previous_cpu_times = cpu_times
+        return percentages
+
+    def read_memory(self):
+        """Get the used and total memory in bytes."""
+        fields = {}
+        for line in self._meminfo_file.read().split(b'\n'):
+            key, _, value = line.partition(b':')
+            if key in (b'MemTotal', b'MemFree', b'MemAvailable',
+                       b'Buffers', b'Cached', b'SReclaimable'):
+                fields[key] = int(value.split()[0]) * 1024
+
+        total = fields[b'MemTotal']
+        if b'MemAvailable' in fields:
+            available = fields[b'MemAvailable']
+        else:
+            # kernels older than 3.14 do not report available memory
+            available = fields[b'MemFree'] + fields.get(b'Buffers', 0) + \
+                fields.get(b'Cached', 0) + fields.get(b'SReclaimable', 0)
+        return total - available, total
+
+    def _is_storage_device(self, name):
+        if name not in self._storage_devices:
+            # whole disks have an entry in /sys/block, partitions do not
+            path = os.path.join('/sys/block', name.replace('/', '!'))
+            self._storage_devices[name] = os.access(path, os.F_OK)
+        return self._storage_devices[name]
+
+    def read_disk_io(self):
+        """Get the read and written bytes of all disks since boot."""
+        read_sectors = 0
+        written_sectors = 0
+        for line in self._diskstats_file.read().split(b'\n'):
+            fields = line.split()
+            # lines of partitions on old kernels only have 7 fields
+            if len(fields) < 14:
+                continue
+            if not self._is_storage_device(fields[2].decode()):
+                continue
+            read_sectors += int(fields[5])
+            written_sectors += int(fields[9])
+        return read_sectors * SECTOR_SIZE, written_sectors * SECTOR_SIZE
+
+    def close(self):
+        self._stat_file.close()
+        self._meminfo_file.close()
+        self._diskstats_file.close()
@@ -0,0 +1,32 @@
+from collections import deque
+
+
+class CounterRate():
+    """
+    The rate per second of a counter which only ever increases, e. g. the
+    number of bytes read from disk since boot. The rate is computed over a
+    sliding window of `window` seconds. Every update is O(1) amortized
+    because old readings are dropped from the left of a deque.
+    """
+    def __init__(self, window=1.):
+        self.window = window
+        # (count, timestamp) tuples with the oldest first
+        self._readings = deque()
+
+    def update(self, count, timestamp):
+        """
+        Add the reading `count` taken at the monotonic time `timestamp`
+        and get the current rate per second.
+        """
+        if self._readings and count < self._readings[-1][0]:
+            # the counter has been reset or wrapped around
+            self._readings.clear()
+
+        self._readings.append((count, timestamp))
+        while timestamp - self._readings[0][1] > self.window:
+            self._readings.popleft()
+
+        first_count, first_timestamp = self._readings[0]
+        if timestamp <= first_timestamp:
+            return 0.
+        return (count - first_count) / (timestamp - first_timestamp)
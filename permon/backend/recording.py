@@ -0,0 +1,314 @@
+import os
+import json
+import mmap
+import struct
+import numpy as np
+
+MAGIC = b'PERMON01'
+# the magic and the length of the JSON header in bytes
+PREFIX = struct.Struct(f'<{len(MAGIC)}sI')
+# the number of contributors stored per row of stats with a breakdown
+CONTRIBUTOR_SLOTS = 5
+
+
+def _round_up(size, multiple):
+    return -(-size // multiple) * multiple
+
+
+def describe(stat_class, stat):
+    """
+    Get the description of a stat stored in the header of a recording.
+    `stat` is the instance the minimum and maximum are read from.
+    """
+    return {
+        'tag': stat_class.tag,
+        'repr': stat_class.get_repr(),
+        'name': stat_class.name,
+        'minimum': stat.minimum,
+        'maximum': stat.maximum,
+        'labels': list(stat_class.labels) if stat_class.is_vector else None,
+        'contributors': stat_class.has_contributor_breakdown
+    }
+
+
+class Layout():
+    """
+    The layout of a recording. After the header, the file consists of
+    blocks of `block_rows` rows. Inside a block, every column is stored
+    contiguously: the timestamps, then the values of every stat and the
+    contributor name ids and values of stats with a breakdown.
+    Blocks are aligned to the allocation granularity so that every block
+    can be mapped on its own.
+    """
+    def __init__(self, header):
+        self.header = header
+        self.block_rows = header['block_rows']
+        self.stats = header['stats']
+
+        rows = self.block_rows
+        # (offset in the block, dtype, shape) of every column
+        self.timestamps = (0, np.float64, (rows,))
+        offset = rows * 8
+        self.values = []
+        self.contributor_ids = []
+        self.contributor_values = []
+        for stat in self.stats:
+            shape = (rows,) if stat['labels'] is None \
+                else (rows, len(stat['labels']))
+            self.values.append((offset, np.float64, shape))
+            offset += int(np.prod(shape)) * 8
+
+            if stat['contributors']:
+                shape = (rows, CONTRIBUTOR_SLOTS)
+                self.contributor_values.append((offset, np.float64, shape))
+                offset += rows * CONTRIBUTOR_SLOTS * 8
+                self.contributor_ids.append((offset, np.uint32, shape))
+                offset += rows * CONTRIBUTOR_SLOTS * 4
+            else:
+                self.contributor_values.append(None)
+                self.contributor_ids.append(None)
+
+        self.block_size = _round_up(offset, mmap.ALLOCATIONGRANULARITY)
+        self.header_size = _round_up(
+            PREFIX.size + len(self.encode_header()),
+            mmap.ALLOCATIONGRANULARITY)
+
+    def encode_header(self):
+        return json.dumps(self.header).encode()
+
+    def block_offset(self, index):
+        return self.header_size + index * self.block_size
+
+    @staticmethod
+    def view(buffer, column):
+        """Get the array of `column` in the mapped block `buffer`."""
+        if column is None:
+            return None
+        offset, dtype, shape = column
+        count = int(np.prod(shape))
+        return np.frombuffer(buffer, dtype=dtype, count=count,
+                             offset=offset).reshape(shape)
+
+
+class RecordingWriter():
+    """
+    Appends rows to a new recording at `path`. Only the block which is
+    currently written is mapped. Blocks are preallocated with zeros and
+    the timestamp of a row is written after its values, so a row with a
+    timestamp of zero is incomplete. Writes go to the page cache, so a
+    killed process loses at most the row it was writing.
+    Contributor names are dictionary encoded: every name is appended once
+    to the side table at `path` + ``.names``, one JSON string per line,
+    and rows only store its line number plus one.
+    """
+    def __init__(self, path, stats, fps, block_rows=4096):
+        header = {
+            'fps': fps,
+            'block_rows': block_rows,
+            'contributor_slots': CONTRIBUTOR_SLOTS,
+            'stats': stats
+        }
+        self.layout = Layout(header)
+        # recordings are never overwritten. the file has to be readable
+        # as well to be mapped
+        self._file = os.fdopen(
+            os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644), 'r+b')
+        self._names_file = open(path + '.names', 'xb', buffering=0)
+        self._name_ids = {}
+
+        encoded = self.layout.encode_header()
+        self._file.write(PREFIX.pack(MAGIC, len(encoded)) + encoded)
+        self._file.truncate(self.layout.header_size)
+        self._file.flush()
+
+        self.n_rows = 0
+        self._block = None
+        self._map = None
+
+    def _map_block(self, index):
+        self._unmap_block()
+
+        offset = self.layout.block_offset(index)
+        # extending the file with truncate leaves the block sparse
+        # and filled with zeros
+        self._file.truncate(offset + self.layout.block_size)
+        self._map = mmap.mmap(self._file.fileno(), self.layout.block_size,
+                              offset=offset)
+        layout = self.layout
+        self._block = {
+            'timestamps': layout.view(self._map, layout.timestamps),
+            'values': [layout.view(self._map, column)
+                       for column in layout.values],
+            'contributor_ids': [layout.view(self._map, column)
+                                for column in layout.contributor_ids],
+            'contributor_values': [layout.view(self._map, column)
+                                   for column in layout.contributor_values]
+        }
+
+    def _unmap_block(self):
+        if self._map is not None:
+            # the arrays have to be released before the map can be closed
+            self._block = None
+            self._map.flush()
+            self._map.close()
+            self._map = None
+
+    def _get_name_id(self, name):
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            # the name is written before any row refers to it
+            self._names_file.write(json.dumps(name).encode() + b'\n')
+            name_id = len(self._name_ids) + 1
+            self._name_ids[name] = name_id
+        return name_id
+
+    def append(self, timestamp, samples):
+        """
+        Append a row of `samples`, one `Sample` per stat in the order of
+        the header. `timestamp` is the wall clock time of the row.
+        """
+        row = self.n_rows % self.layout.block_rows
+        if row == 0:
+            self._map_block(self.n_rows // self.layout.block_rows)
+
+        block = self._block
+        for i, sample in enumerate(samples):
+            block['values'][i][row] = sample.value
+
+            ids = block['contributor_ids'][i]
+            if ids is not None:
+                values = block['contributor_values'][i]
+                contributors = sample.contributors[:CONTRIBUTOR_SLOTS]
+                for slot, (name, value) in enumerate(contributors):
+                    ids[row, slot] = self._get_name_id(name)
+                    values[row, slot] = value
+
+        block['timestamps'][row] = timestamp
+        self.n_rows += 1
+
+    def close(self):
+        self._unmap_block()
+        self._file.close()
+        self._names_file.close()
+
+
+class RecordingReader():
+    """
+    Reads a recording written by `RecordingWriter`. Blocks are mapped
+    read-only when they are read. Incomplete rows at the end of a
+    recording, e. g. of a killed recorder, are ignored.
+    """
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        magic, header_length = PREFIX.unpack(self._file.read(PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a permon recording.')
+        self.layout = Layout(json.loads(self._file.read(header_length)))
+        self.header = self.layout.header
+        self.stats = self.layout.stats
+
+        with open(path + '.names', 'rb') as names_file:
+            # id 0 is an empty slot
+            self.names = [None] + [json.loads(line) for line in names_file
+                                   if line.endswith(b'\n')]
+
+        # the last mapped block and its index
+        self._cached_block = (None, None)
+
+        file_size = os.fstat(self._file.fileno()).st_size
+        self.n_blocks = max(file_size - self.layout.header_size, 0) // \
+            self.layout.block_size
+        self.n_rows = 0
+        if self.n_blocks > 0:
+            last_rows = np.count_nonzero(
+                self.read_block(self.n_blocks - 1)['timestamps'])
+            if last_rows == 0:
+                # the recorder has been stopped before the first row
+                # of the block was complete, so the previous one is full
+                self.n_blocks -= 1
+                last_rows = self.layout.block_rows
+        if self.n_blocks > 0:
+            self.n_rows = (self.n_blocks - 1) * self.layout.block_rows + \
+                last_rows
+
+        # a sparse index of the timestamp of the first row of every
+        # block. it is read without mapping the blocks
+        self.index = np.empty(self.n_blocks)
+        for i in range(self.n_blocks):
+            self._file.seek(self.layout.block_offset(i))
+            self.index[i] = np.frombuffer(self._file.read(8),
+                                          dtype=np.float64)[0]
+
+    @property
+    def start_time(self):
+        """The wall clock time of the first row or None if there is none."""
+        return self.index[0] if self.n_rows > 0 else None
+
+    def seek(self, timestamp):
+        """
+        Get the number of the last row recorded at or before `timestamp`
+        or of the first row if there is none. Finds the block in the
+        sparse index, so only one block is read.
+        """
+        block_index = max(np.searchsorted(self.index, timestamp,
+                                          side='right') - 1, 0)
+        n_block_rows = min(self.n_rows - block_index *
+                           self.layout.block_rows, self.layout.block_rows)
+        timestamps = self.read_block(block_index)['timestamps']
+        row = np.searchsorted(timestamps[:n_block_rows], timestamp,
+                              side='right') - 1
+        return block_index * self.layout.block_rows + max(row, 0)
+
+    def get_sample(self, position, stat_index):
+        """
+        Get the value and the contributors of the stat with `stat_index`
+        in the row with the number `position`.
+        """
+        block_index, row = divmod(position, self.layout.block_rows)
+        block = self.read_block(block_index)
+        value = block['values'][stat_index][row]
+        # vector values are copied so they stay valid without the block
+        value = value.copy() if value.ndim else float(value)
+        return value, self.get_contributors(block, stat_index, row)
+
+    def read_block(self, index):
+        """
+        Get the columns of the block with `index` as a dictionary with
+        the same keys as the blocks of `RecordingWriter`. The last block
+        is cached, so reading rows in order maps every block once.
+        """
+        if self._cached_block[0] == index:
+            return self._cached_block[1]
+
+        layout = self.layout
+        buffer = mmap.mmap(self._file.fileno(), layout.block_size,
+                           offset=layout.block_offset(index),
+                           access=mmap.ACCESS_READ)
+        block = {
+            'timestamps': layout.view(buffer, layout.timestamps),
+            'values': [layout.view(buffer, column)
+                       for column in layout.values],
+            'contributor_ids': [layout.view(buffer, column)
+                                for column in layout.contributor_ids],
+            'contributor_values': [layout.view(buffer, column)
+                                   for column in layout.contributor_values]
+        }
+        self._cached_block = (index, block)
+        return block
+
+    def get_contributors(self, block, stat_index, row):
+        """
+        Get the (name, value) contributors of the stat with `stat_index`
+        in `row` of `block`.
+        """
+        ids = block['contributor_ids'][stat_index]
+        if ids is None:
+            return []
+        values = block['contributor_values'][stat_index]
+        return [(self.names[name_id], value)
+                for name_id, value in zip(ids[row].tolist(),
+                                          values[row].tolist())
+                if name_id != 0]
+
+    def close(self):
+        self._file.close()
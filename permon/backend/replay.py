@@ -0,0 +1,131 @@
+import logging
+import threading
+from abc import ABC
+import numpy as np
+from permon.backend import Stat, Sample, sampling
+
+
+class ReplayStat(Stat, ABC):
+    """
+    Base class for the stats of a replayed recording. `ReplaySession`
+    makes one subclass per recorded stat, which has the tag of the
+    recorded stat and reads its values from the session instead of
+    measuring them. ABC is one of the bases of the subclasses, so they
+    are not registered as available stats.
+    """
+    session = None
+    # the index of the stat in the recording
+    index = None
+    recorded_minimum = None
+    recorded_maximum = None
+
+    @classmethod
+    def make(cls, session, index, description):
+        """Make the stat class of the recorded stat with `description`."""
+        root_tag, base_tag = description['tag'].split('.', 1)
+        labels = description['labels']
+        attributes = {
+            'name': description['name'],
+            'root_tag': root_tag,
+            'base_tag': base_tag,
+            'tag': description['tag'],
+            'is_vector': labels is not None,
+            'has_contributor_breakdown': description['contributors'],
+            'settings': {},
+            'sample_interval': None,
+            'deadline': None,
+            'isolated': False,
+            '_initialized': True,
+            'session': session,
+            'index': index,
+            'recorded_minimum': description['minimum'],
+            'recorded_maximum': description['maximum']
+        }
+        if labels is not None:
+            attributes['labels'] = labels
+        return type(f'Replay{root_tag.title()}{base_tag.title()}',
+                    (cls, ABC), attributes)
+
+    @classmethod
+    def make_sample(cls, result):
+        if cls.is_vector:
+            return Sample(np.asarray(result, dtype=float), [])
+        return super(ReplayStat, cls).make_sample(result)
+
+    def empty_sample(self):
+        if self.is_vector:
+            return Sample(np.full(len(self.labels),
+                                  float(self.minimum or 0.)), [])
+        return super(ReplayStat, self).empty_sample()
+
+    def get_stat(self):
+        value, contributors = self.session.get_sample(
+            self.index, sampling.hub.timestamp())
+        if self.has_contributor_breakdown:
+            return value, contributors
+        return value
+
+    @property
+    def minimum(self):
+        return self.recorded_minimum
+
+    @property
+    def maximum(self):
+        return self.recorded_maximum
+
+
+class ReplaySession():
+    """
+    Plays back a recording read by `recording.RecordingReader`, starting
+    `start` seconds after its first row. The replay clock maps the ticks
+    of the frontend to rows: the row shown at a tick is the last one
+    recorded before the time since the first tick times `speed` has
+    passed in the recording. If `fast` is set, every tick shows the next
+    row instead, so a frontend ticking without waiting replays the
+    recording as fast as it can draw it.
+    `stats` holds the stat classes to pass to a `MonitorApp`.
+    """
+    def __init__(self, reader, start=0., speed=1., fast=False):
+        if reader.n_rows == 0:
+            raise ValueError('The recording is empty.')
+
+        self.reader = reader
+        self.speed = speed
+        self.fast = fast
+        self.start_time = reader.start_time + start
+        self.stats = [ReplayStat.make(self, index, description)
+                      for index, description in enumerate(reader.stats)]
+
+        # stats are called from their own threads
+        self._lock = threading.Lock()
+        self._first_tick = None
+        self._tick = None
+        self._position = reader.seek(self.start_time)
+        self.finished = False
+
+    def _move_to(self, tick):
+        if self._first_tick is None:
+            self._first_tick = tick
+        elif self.fast:
+            self._position += 1
+        else:
+            timestamp = self.start_time + \
+                (tick - self._first_tick) * self.speed
+            self._position = self.reader.seek(timestamp)
+
+        last_position = self.reader.n_rows - 1
+        if self._position >= last_position and not self.finished:
+            logging.info('Reached the end of the recording')
+            self.finished = True
+        self._position = min(self._position, last_position)
+        self._tick = tick
+
+    def get_sample(self, index, tick):
+        """
+        Get the value and the contributors of the stat with `index`
+        in the row shown at the monotonic time `tick`.
+        """
+        with self._lock:
+            if tick != self._tick:
+                self._move_to(tick)
+            return self.reader.get_sample(self._position, index)
@@ -0,0 +1,164 @@
+import os
+import threading
+import logging
+import time
+import concurrent.futures
+from contextlib import contextmanager
+import psutil
+from permon.backend import procfs
+
+
+class SamplingHub():
+    """
+    Collects the data sources shared by multiple stats.
+    Inside of a tick, every source is read at most once and the result
+    is handed to every stat that asks for it. Outside of a tick, every
+    read hits the underlying source.
+
+    Stats are called from their own threads, so sources are read outside
+    of the lock. The first stat asking for a source reads it, stats asking
+    for it in the same tick wait for that read.
+    """
+    def __init__(self):
+        self._sources = {}
+        self._snapshot = None
+        self._timestamp = None
+        self._depth = 0
+        self._lock = threading.Lock()
+
+    def register_source(self, name, function):
+        """
+        Register `function` as the source with `name`.
+        `function` must take no arguments and return the current reading.
+        Registering an existing name replaces the previous source.
+        """
+        with self._lock:
+            self._sources[name] = function
+
+    def _reset(self):
+        """
+        Forget the current tick. Used in forked processes which do not
+        have the thread the tick has been started in.
+        """
+        self._snapshot = None
+        self._timestamp = None
+        self._depth = 0
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """Get the reading of the source with `name` for the current tick."""
+        with self._lock:
+            source = self._sources[name]
+            if self._snapshot is None:
+                future = None
+            elif name in self._snapshot:
+                future = self._snapshot[name]
+                source = None
+            else:
+                future = concurrent.futures.Future()
+                self._snapshot[name] = future
+
+        if future is None:
+            return source()
+        if source is not None:
+            # this call reads the source for everyone in the tick
+            try:
+                future.set_result(source())
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+        return future.result()
+
+    def timestamp(self):
+        """
+        Get the monotonic time the current tick has been captured at.
+        Outside of a tick, this is the current time.
+        """
+        with self._lock:
+            if self._timestamp is None:
+                return time.monotonic()
+            return self._timestamp
+
+    @contextmanager
+    def tick(self, timestamp=None):
+        """
+        Context manager which makes all reads inside of it share one
+        snapshot of the sources. Ticks can be nested, the snapshot
+        is discarded when the outermost tick exits.
+        `timestamp` is the monotonic time the tick is captured at and
+        defaults to the current time.
+        """
+        with self._lock:
+            if self._depth == 0:
+                self._snapshot = {}
+                self._timestamp = timestamp if timestamp is not None \
+                    else time.monotonic()
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._snapshot = None
+                    self._timestamp = None
+
+
+def _read_memory():
+    memory = psutil.virtual_memory()
+    return memory.used, memory.total
+
+
+def _read_disk_io():
+    counters = psutil.disk_io_counters()
+    return counters.read_bytes, counters.write_bytes
+
+
+def register_psutil_sources(hub):
+    """Register the sources read through psutil on `hub`."""
+    hub.register_source('cpu_percent',
+                        lambda: psutil.cpu_percent(percpu=True))
+    hub.register_source('memory', _read_memory)
+    hub.register_source('disk_io', _read_disk_io)
+
+
+def register_procfs_sources(hub):
+    """
+    Register the sources read directly from /proc on `hub`.
+    Only works if `procfs.is_available()` is true.
+    """
+    reader = procfs.ProcReader()
+
+    def with_fallback(function, name):
+        def read():
+            try:
+                return function()
+            except OSError as e:
+                # if /proc can not be read anymore, switch back to psutil
+                logging.warning(f'Reading /proc failed ({e}). '
+                                'Falling back to psutil.')
+                reader.close()
+                register_psutil_sources(hub)
+                return hub._sources[name]()
+        return read
+
+    hub.register_source('cpu_percent',
+                        with_fallback(reader.read_cpu_percent, 'cpu_percent'))
+    hub.register_source('memory',
+                        with_fallback(reader.read_memory, 'memory'))
+    hub.register_source('disk_io',
+                        with_fallback(reader.read_disk_io, 'disk_io'))
+
+
+# all sources return sizes in bytes
+hub = SamplingHub()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=hub._reset)
+register_psutil_sources(hub)
+# prefer reading /proc directly, psutil stays the fallback
+# on all other systems
+if procfs.is_available():
+    try:
+        register_procfs_sources(hub)
+    except OSError:
+        pass
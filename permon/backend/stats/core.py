@@ -1,9 +1,17 @@
+import os
 import time
 import re
+import heapq
+from collections import deque
+import logging
 import threading
 import subprocess
+import asyncio
+from abc import ABC, abstractmethod
 import psutil
-from permon.backend import Stat
+import numpy as np
+from permon.backend import (Stat, VectorStat, CounterStat, sampling,
+                            lifecycle, cgroups, procfs)
 from permon import exceptions
 
 
@@ -11,25 +19,43 @@ class CPUStat(Stat):
     """
     tag: ``core.cpu_usage``
 
-    settings: none
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "contributors": "processes"
+        }
 
     Tracks the CPU usage of the user.
     Also returns the top contributors to the CPU usage.
+
+    ``contributors`` is either ``processes`` to show the usage per
+    process name or ``cgroups`` to show the usage per cgroup, e. g. per
+    systemd service or container. ``cgroups`` needs the cgroup v2
+    hierarchy mounted at ``/sys/fs/cgroup``.
     """
     name = 'CPU Usage [%]'
     base_tag = 'cpu_usage'
+    has_contributor_breakdown = True
+    default_settings = {
+        'contributors': 'processes'
+    }
 
-    def __init__(self, fps):
-        # get a new wrapper around the process tracker singleton
-        self.proc_tracker = ProcessTracker()
+    def start(self):
+        # the tracker is shared with the other stats using it
+        self.tracker_class = get_contributor_tracker(
+            self.settings['contributors'])
+        self.tracker = self.tracker_class.acquire()
 
-        super(CPUStat, self).__init__(fps=fps)
+    def stop(self):
+        self.tracker_class.release()
 
     def get_stat(self):
         # get the sum of all CPU cores.
-        cpu_percent = sum(psutil.cpu_percent(percpu=True))
-        # get the top contributors to CPU usage from the process tracker
-        contributors = self.proc_tracker.get_contributors(
+        cpu_percent = sum(sampling.hub.get('cpu_percent'))
+        # get the top contributors to CPU usage from the tracker
+        contributors = self.tracker.get_contributors(
             'cpu', adapt_to=cpu_percent)
 
         return cpu_percent, contributors
@@ -45,32 +71,78 @@ class CPUStat(Stat):
         return 100 * psutil.cpu_count()
 
 
+class CPUCoreStat(VectorStat):
+    """
+    tag: ``core.cpu_usage_per_core``
+
+    settings: none
+
+    Tracks the usage of every CPU core.
+    """
+    name = 'CPU Usage per Core [%]'
+    base_tag = 'cpu_usage_per_core'
+    labels = [f'CPU {i}' for i in range(psutil.cpu_count())]
+
+    def get_stat(self):
+        # the same reading the CPU usage stat sums up
+        return np.array(sampling.hub.get('cpu_percent'))
+
+    @property
+    def minimum(self):
+        return 0
+
+    @property
+    def maximum(self):
+        return 100
+
+
 class RAMStat(Stat):
     """
     tag: ``core.ram_usage``
 
-    settings: none
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "contributors": "processes"
+        }
 
     Tracks the RAM usage of the user.
     Also returns the top contributors to the RAM usage.
+
+    ``contributors`` is either ``processes`` to show the usage per
+    process name or ``cgroups`` to show the usage per cgroup, e. g. per
+    systemd service or container. ``cgroups`` needs the cgroup v2
+    hierarchy mounted at ``/sys/fs/cgroup``.
     """
     name = 'RAM Usage [MB]'
     base_tag = 'ram_usage'
+    has_contributor_breakdown = True
+    default_settings = {
+        'contributors': 'processes'
+    }
 
     def __init__(self, fps):
-        # get a new wrapper around the process tracker singleton
-        self.proc_tracker = ProcessTracker()
-
         # calculate the maximum in MB, psutil returns bytes
-        self._maximum = psutil.virtual_memory().total / 1000**2
+        self._maximum = sampling.hub.get('memory')[1] / 1000**2
         super(RAMStat, self).__init__(fps=fps)
 
+    def start(self):
+        # the tracker is shared with the other stats using it
+        self.tracker_class = get_contributor_tracker(
+            self.settings['contributors'])
+        self.tracker = self.tracker_class.acquire()
+
+    def stop(self):
+        self.tracker_class.release()
+
     def get_stat(self):
-        # get the currently used memory from psutil
-        actual_memory = psutil.virtual_memory().used / 1000**2
-        # get the contributors from the process tracker
-        contributors = self.proc_tracker.get_contributors(
-            'ram', adapt_to=actual_memory)
+        # get the currently used memory from the sampling hub
+        actual_memory = sampling.hub.get('memory')[0] / 1000**2
+        # get the contributors from the tracker
+        contributors = self.tracker.get_contributors(
+            'ram', adapt_to=actual_memory, scale=1 / 1000**2)
 
         return actual_memory, contributors
 
@@ -94,9 +166,14 @@ class GPUStat(Stat):
     must be installed. To check if it is installed, type ``nvidia-smi``
     in your command line and see if the command was found.
 
+    Polled once per second by default because every poll runs
+    ``nvidia-smi``, which may take longer than a frame.
     """
     name = 'vRAM Usage [MB]'
     base_tag = 'vram_usage'
+    default_sample_interval = 1.
+    default_deadline = 1.
+    vram_command = ['nvidia-smi', '--display=MEMORY', '-q']
 
     @classmethod
     def check_availability(cls):
@@ -111,24 +188,27 @@ class GPUStat(Stat):
 
     def __init__(self, fps):
         super(GPUStat, self).__init__(fps=fps)
-        self._maximum = self._get_used_and_total()[1]
+        out = subprocess.check_output(self.vram_command)
+        self._maximum = self._parse_used_and_total(out)[1]
 
-    def _get_used_and_total(self):
+    def _parse_used_and_total(self, out):
         """
         Extract and return the used and total vRAM, respectively
-        from nvidia-smi.
+        from the output of nvidia-smi.
         """
-        vram_command = ['nvidia-smi', '--display=MEMORY', '-q']
-
-        out = subprocess.check_output(vram_command)
         out = out.decode('utf-8').split('\n')[8:]
 
         total = int(out[1].split()[2])
         used = int(out[2].split()[2])
         return used, total
 
-    def get_stat(self):
-        return self._get_used_and_total()[0]
+    async def get_stat(self):
+        # nvidia-smi is run asynchronously so that waiting for it
+        # does not need a thread
+        process = await asyncio.create_subprocess_exec(
+            *self.vram_command, stdout=asyncio.subprocess.PIPE)
+        out, _ = await process.communicate()
+        return self._parse_used_and_total(out)[0]
 
     @property
     def minimum(self):
@@ -139,37 +219,43 @@ class GPUStat(Stat):
         return self._maximum
 
 
-class ReadStat(Stat):
+class ReadStat(CounterStat):
     """
     tag: ``core.read_speed``
 
-    settings: none
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "window [s]": 1
+        }
 
     Tracks the disk read speed of the user.
+    Also returns the processes reading the most.
+    ``window [s]`` is the time the speed is averaged over.
     """
     name = 'Disk Read Speed [MB / s]'
     base_tag = 'read_speed'
+    has_contributor_breakdown = True
+    # the counter is in bytes
+    scale = 1 / 1000**2
 
-    def __init__(self, fps):
-        self.cache = []
-        # start_bytes is equal to the number of bytes that have been
-        # read since startup
-        self.start_bytes = psutil.disk_io_counters().read_bytes
-        super(ReadStat, self).__init__(fps=fps)
+    def start(self):
+        # the tracker is shared with the other stats using it
+        self.tracker = ProcessTracker.acquire()
+
+    def stop(self):
+        ProcessTracker.release()
 
     def get_stat(self):
-        # subtract the read bytes since startup from the
-        # bytes that have been read before permon has been started
-        stat = psutil.disk_io_counters().read_bytes - self.start_bytes
-        current_time = time.time()
-        # append the difference in bytes and the current time to a cache
-        self.cache.append((stat, current_time))
-        # remove all entries from the cache that are older than 1 second
-        self.cache = [(x, t) for x, t in self.cache if current_time - t <= 1]
-
-        # return the difference between the last and first entry of the cache
-        # this is equal to the bytes read since the last second
-        return float(self.cache[-1][0] - self.cache[0][0]) / 1000**2
+        speed = super(ReadStat, self).get_stat()
+        contributors = self.tracker.get_contributors(
+            'read', adapt_to=speed, scale=self.scale)
+        return speed, contributors
+
+    def read_counter(self):
+        return sampling.hub.get('disk_io')[0]
 
     @property
     def minimum(self):
@@ -181,37 +267,43 @@ class ReadStat(Stat):
         return None
 
 
-class WriteStat(Stat):
+class WriteStat(CounterStat):
     """
     tag: ``core.write_speed``
 
-    settings: none
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "window [s]": 1
+        }
 
     Tracks the disk write speed of the user.
+    Also returns the processes writing the most.
+    ``window [s]`` is the time the speed is averaged over.
     """
     name = 'Disk Write Speed [MB / s]'
     base_tag = 'write_speed'
+    has_contributor_breakdown = True
+    # the counter is in bytes
+    scale = 1 / 1000**2
 
-    def __init__(self, fps):
-        self.cache = []
-        # start_bytes is equal to the number of bytes that have been
-        # written since startup
-        self.start_bytes = psutil.disk_io_counters().write_bytes
-        super(WriteStat, self).__init__(fps=fps)
+    def start(self):
+        # the tracker is shared with the other stats using it
+        self.tracker = ProcessTracker.acquire()
+
+    def stop(self):
+        ProcessTracker.release()
 
     def get_stat(self):
-        # subtract the written bytes since startup from the
-        # bytes that have been written before permon has been started
-        stat = psutil.disk_io_counters().write_bytes - self.start_bytes
-        current_time = time.time()
-        # append the difference in bytes and the current time to a cache
-        self.cache.append((stat, current_time))
-        # remove all entries from the cache that are older than 1 second
-        self.cache = [(x, t) for x, t in self.cache if current_time - t <= 1]
-
-        # return the difference between the last and first entry of the cache
-        # this is equal to the bytes read since the last second
-        return float(self.cache[-1][0] - self.cache[0][0]) / 1000**2
+        speed = super(WriteStat, self).get_stat()
+        contributors = self.tracker.get_contributors(
+            'write', adapt_to=speed, scale=self.scale)
+        return speed, contributors
+
+    def read_counter(self):
+        return sampling.hub.get('disk_io')[1]
 
     @property
     def minimum(self):
@@ -223,6 +315,36 @@ class WriteStat(Stat):
         return None
 
 
+class ContextSwitchStat(CounterStat):
+    """
+    tag: ``core.context_switches``
+
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "window [s]": 1
+        }
+
+    Tracks the number of context switches per second of all CPUs.
+    ``window [s]`` is the time the rate is averaged over.
+    """
+    name = 'Context Switches [1 / s]'
+    base_tag = 'context_switches'
+
+    def read_counter(self):
+        return psutil.cpu_stats().ctx_switches
+
+    @property
+    def minimum(self):
+        return 0
+
+    @property
+    def maximum(self):
+        return None
+
+
 class CPUTempStat(Stat):
     """
     tag: ``core.cpu_temp``
@@ -276,114 +398,373 @@ class CPUTempStat(Stat):
         return self._maximum
 
 
-class ProcessTracker():
+class ContributorTracker(ABC):
+    """
+    Base class of trackers reading the contributors to the usage of a
+    resource, e. g. the CPU usage of every process, in a background thread.
+    Every `scan_period` seconds `_scan` is called and the top contributors
+    of its result are published for `get_contributors`.
+
+    Every tracker class has at most one instance which is shared by all
+    stats using it and runs while at least one of them has acquired it.
+    """
+    scan_period = 2.
+    # the number of top contributors kept per tag after every scan
+    top_k = 5
+    tags = ['cpu', 'ram']
+
+    # maps tracker classes to their shared instance and number of users
+    _instances = {}
+    _n_users = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls):
+        """Get the shared tracker and start it if it is not running yet."""
+        with ContributorTracker._lock:
+            if cls not in cls._instances:
+                cls._instances[cls] = cls()
+                cls._instances[cls].start()
+                cls._n_users[cls] = 0
+            cls._n_users[cls] += 1
+            return cls._instances[cls]
+
+    @classmethod
+    def release(cls):
+        """Stop the shared tracker once no stat uses it anymore."""
+        with ContributorTracker._lock:
+            cls._n_users[cls] -= 1
+            if cls._n_users[cls] == 0:
+                cls._instances.pop(cls).stop()
+                del cls._n_users[cls]
+
+    @staticmethod
+    def _reset():
+        # the threads of the trackers do not exist in a forked process
+        ContributorTracker._instances = {}
+        ContributorTracker._n_users = {}
+        ContributorTracker._lock = threading.Lock()
+
+    def __init__(self):
+        # maps names of contributors to their value for every tag
+        self.values = {}
+        # the number of contributors whose values could not be read
+        self.n_denied = 0
+        # maps tags to the top contributors and the sum of all of them
+        self._snapshots = {}
+        self._thread = lifecycle.BackgroundThread(
+            self._run, name=f'permon-{type(self).__name__}')
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Stop the tracker. Returns whether its thread has stopped."""
+        return self._thread.stop()
+
+    def _run(self, stop_event):
+        while not stop_event.is_set():
+            start = time.monotonic()
+            self._publish(self._scan(stop_event))
+            # wait for the rest of the period before the next scan
+            stop_event.wait(
+                max(self.scan_period - (time.monotonic() - start), 0))
+
+    @abstractmethod
+    def _scan(self, stop_event):
+        """
+        Read the current values of all contributors. Returns a dictionary
+        mapping the names of the contributors to dictionaries of their
+        value for every tag. Should return early if `stop_event` is set.
+        """
+        pass
+
+    def _publish(self, values):
+        """
+        Publish the values read in a scan and select the top contributors
+        to every tag, so readers do not have to sort all contributors
+        every frame.
+        """
+        snapshots = {}
+        for tag in self.tags:
+            # values which are updated incrementally and should be zero
+            # can be off by a rounding error
+            tag_values = [(name, value[tag]) for name, value in values.items()
+                          if value[tag] > 1e-9]
+            top = heapq.nlargest(self.top_k, tag_values, key=lambda x: x[1])
+            snapshots[tag] = (top, sum(x[1] for x in tag_values))
+
+        self.values = values
+        self._snapshots = snapshots
+
+    def get_contributors(self, tag, n=5, adapt_to=None, scale=1.):
+        """
+        Get the top n contributors to a tag
+        where `tag` is either `cpu` or `ram`.
+        At most `top_k` contributors are returned.
+        If adapt_to is not None, scale the contributors such that
+        their sum is equal to adapt_to. `scale` converts the values of
+        the tracker to the unit of adapt_to. If some contributors could
+        not be read, the part of adapt_to the others do not account for
+        is returned as ``unattributed`` instead.
+        """
+        if tag not in self._snapshots:
+            return []
+
+        top, value_sum = self._snapshots[tag]
+        unattributed = 0.
+        if adapt_to is not None and self.n_denied > 0:
+            unattributed = max(adapt_to - value_sum * scale, 0.)
+        # if there are contributors but all of them are zero
+        # return early too
+        if len(top) == 0 and unattributed == 0:
+            return []
+
+        if adapt_to is None:
+            return [[key, value] for key, value in top[:n]]
+
+        if unattributed > 0:
+            contributors = [[key, value * scale]
+                            for key, value in top[:n-2]]
+            contributors.insert(0, ['unattributed', unattributed])
+        else:
+            # scale the contributors so that they amount to adapt_to
+            factor = adapt_to / max(value_sum, 1e-6)
+            contributors = [[key, value * factor]
+                            for key, value in top[:n-1]]
+        # combine the contributors that are smaller than the top n
+        # into one
+        remainder = adapt_to - sum(x[1] for x in contributors)
+        contributors.insert(0, ['other', remainder])
+
+        return contributors
+
+
+class ProcessTracker(ContributorTracker):
     """
-    Singleton wrapper for tracking process information like cpu and
-    RAM usage of each process. Needed by core.ram_usage and core.cpu_usage
-    for their contributor breakdown.
+    Tracks the cpu and RAM usage of every process, summed up per process
+    name.
+    A pass over all processes is spread over `scan_period` seconds and
+    uses at most `max_cpu_share` of one core. The scan pauses whenever
+    it is ahead of its CPU budget instead of after every process, so
+    the number of processes does not slow it down needlessly.
+
+    The disk I/O of a process is the change of its I/O counters since
+    the previous pass.
+
+    The RAM usage of a process is its proportional set size (PSS) where
+    it can be read and its resident set size (RSS) otherwise. Reading
+    the PSS is expensive, so it is only refreshed for the `pss_top_n`
+    processes using the most RAM and `pss_batch` other processes in
+    turn every pass. In between, the last PSS is used.
     """
-    instance = None
-    n_wrapper_instances = 0
+    max_cpu_share = .05
+    # pauses shorter than this are postponed and merged with later ones
+    min_pause = .005
+    pss_top_n = 10
+    pss_batch = 50
+    # read and write are the disk I/O of a process in bytes per second
+    tags = ['cpu', 'ram', 'read', 'write']
 
     def __init__(self):
-        if not self.instance:
-            ProcessTracker.instance = self._ProcessTracker()
-        ProcessTracker.n_wrapper_instances += 1
-
-    def __del__(self):
-        ProcessTracker.n_wrapper_instances -= 1
-        if self.n_wrapper_instances == 0:
-            self.instance._stop = True
-            while not self.instance._stopped:
+        super(ProcessTracker, self).__init__()
+        # maps (pid, create_time) of every process to its name and
+        # values, and names to the sums of the values of their processes.
+        # both are only used by the scanning thread
+        self._table = {}
+        self._totals = {}
+        self._has_pss = procfs.is_pss_available()
+        # keys of the processes permon is not allowed to read
+        self._denied = set()
+        # keys of processes in the order their PSS is refreshed in
+        self._pss_queue = deque()
+
+    def _add_entry(self, key, proc):
+        """Add the process `proc` to the table under `key`."""
+        # names almost never change, so they are only normalized once
+        name = re.split(r'[\W\s]+', proc.name())[0]
+        entry = {'name': name, 'pss': None, 'io': None}
+        for tag in self.tags:
+            entry[tag] = 0
+        self._table[key] = entry
+        self._pss_queue.append(key)
+
+        if name not in self._totals:
+            self._totals[name] = {'n_processes': 0}
+            for tag in self.tags:
+                self._totals[name][tag] = entry[tag]
+        self._totals[name]['n_processes'] += 1
+        return entry
+
+    def _update_entry(self, entry, **values):
+        """Update `entry` and the totals of its name with `values`."""
+        totals = self._totals[entry['name']]
+        for tag, value in values.items():
+            totals[tag] += value - entry[tag]
+            entry[tag] = value
+
+    def _remove_entry(self, key):
+        """Remove the process with `key` which does not exist anymore."""
+        entry = self._table.pop(key)
+        self._update_entry(entry, **{tag: 0 for tag in self.tags})
+
+        totals = self._totals[entry['name']]
+        totals['n_processes'] -= 1
+        if totals['n_processes'] == 0:
+            del self._totals[entry['name']]
+
+    def _read_io(self, proc):
+        """
+        Get the bytes read from and written to disk by `proc` and the
+        time they have been read at, or None if they can not be read.
+        """
+        try:
+            counters = proc.io_counters()
+        except (psutil.AccessDenied, AttributeError):
+            # the I/O of processes of other users is not accessible and
+            # io_counters does not exist on macOS
+            return None
+        return counters.read_bytes, counters.write_bytes, time.monotonic()
+
+    def _get_pss_due(self):
+        """Get the keys of the processes to refresh the PSS of."""
+        if not self._has_pss:
+            return set()
+
+        due = set(heapq.nlargest(self.pss_top_n, self._table,
+                                 key=lambda key: self._table[key]['ram']))
+        # the other processes are refreshed round-robin
+        for _ in range(min(self.pss_batch, len(self._pss_queue))):
+            key = self._pss_queue.popleft()
+            # processes which have exited are dropped from the queue
+            if key in self._table:
+                due.add(key)
+                self._pss_queue.append(key)
+        return due
+
+    def _scan(self, stop_event):
+        # read the cpu and ram usage of all running processes
+        start = time.monotonic()
+        start_cpu_time = time.thread_time()
+        seen = set()
+        completed = True
+        pss_due = self._get_pss_due()
+
+        denied = set()
+
+        for proc in psutil.process_iter():
+            try:
+                # processes are identified by their pid and creation
+                # time because pids are reused
+                key = (proc.pid, proc.create_time())
+            except psutil.NoSuchProcess:
+                continue
+            except psutil.AccessDenied:
+                key = (proc.pid, None)
+            if key in self._denied:
+                # do not pay for the failing calls again
+                denied.add(key)
                 continue
 
-            ProcessTracker.instance = None
-
-    def __getattr__(self, attr):
-        return getattr(self.instance, attr)
-
-    class _ProcessTracker():
-        """Class actually tracking the processes."""
-        def __init__(self):
-            self._stop = False
-            self._stopped = False
-            self.processes = {}
-
-            # start a thread for continuously reading all processes
-            self._thread = threading.Thread(target=self._read_processes)
-            self._thread.start()
-
-        def _read_processes(self):
-            # while the tracker is running, read the cpu and ram usage
-            # of all running processes
-            while not self._stop:
-                iterator = psutil.process_iter()
-                _processes = {}
-
-                for proc in iterator:
-                    name = re.split(r'[\W\s]+', proc.name())[0]
-                    try:
-                        proc_cpu_usage = proc.cpu_percent()
-                        proc_memory = proc.memory_info().vms
-                    except psutil._exceptions.AccessDenied:
-                        # an AccessDenied error might occur if permon is not
-                        # allowed to view the stats of distinct processes
-                        # in that case, stop the process tracker thread
-                        break
-
-                    if name not in _processes:
-                            _processes[name] = {
-                                'cpu': proc_cpu_usage,
-                                'ram': proc_memory
-                            }
-                    else:
-                        _processes[name]['cpu'] += proc_cpu_usage
-                        _processes[name]['ram'] += proc_memory
-
-                    # sleep for a short time to allow the UI thread to continue
-                    if self._stop:
-                        break
-                    time.sleep(0.02)
-
-                self.processes = _processes
-
-            self._stopped = True
-
-        def get_contributors(self, tag, n=5, adapt_to=None):
-            """
-            Get the top n contributors to a tag
-            where `tag` is either `cpu` or `ram`.
-            If adapt_to is not None, scale the contributors such that
-            their sum is equal to adapt_to.
-            """
-            if not self.processes:
-                return []
-
-            processes = self.processes.items()
-            contributors = sorted(processes, key=lambda proc: proc[1][tag],
-                                  reverse=True)
-            contributors = [[key, value[tag]] for key, value in contributors
-                            if value[tag] != 0]
-            # if there are contributors but all of them are zero
-            # return early too
-            if len(contributors) == 0:
-                return []
-
-            if adapt_to is not None:
-                value_sum = max(sum(x[1] for x in contributors), 1e-6)
-                # scale the contributors so that they amount to adapt_to
-                for i, (_, value) in enumerate(contributors):
-                    contributors[i][1] = value / value_sum * adapt_to
-                # combine the contributors that are smaller than the top n
-                # into one
-                remainder = adapt_to - sum(x[1] for x in contributors[:n-1])
-                contributors.insert(0, ['other', remainder])
-
-            return contributors[:n]
-
-    def delete_instance(self):
-        self.instance._stop = True
-        while not self._stopped:
-            continue
-
-        self.instance = None
+            try:
+                entry = self._table.get(key)
+                if entry is None:
+                    entry = self._add_entry(key, proc)
+                # read all values with as few syscalls as possible
+                with proc.oneshot():
+                    proc_cpu_usage = proc.cpu_percent()
+                    proc_memory = proc.memory_info().rss
+                    proc_io = self._read_io(proc)
+            except psutil.NoSuchProcess:
+                # the process has exited since it was listed
+                continue
+            except psutil.AccessDenied:
+                # permon is not allowed to read the process, e. g. one
+                # of another user. its usage stays unattributed
+                denied.add(key)
+                if key in self._table:
+                    self._remove_entry(key)
+                continue
+
+            if key in pss_due:
+                try:
+                    entry['pss'] = procfs.read_pss(proc.pid)
+                except OSError:
+                    # e. g. processes of other users
+                    entry['pss'] = None
+            if entry['pss'] is not None:
+                proc_memory = entry['pss']
+
+            read_speed, write_speed = 0., 0.
+            if proc_io is not None and entry['io'] is not None:
+                elapsed = proc_io[2] - entry['io'][2]
+                if elapsed > 0:
+                    read_speed = (proc_io[0] - entry['io'][0]) / elapsed
+                    write_speed = (proc_io[1] - entry['io'][1]) / elapsed
+            entry['io'] = proc_io
+
+            seen.add(key)
+            self._update_entry(entry, cpu=proc_cpu_usage, ram=proc_memory,
+                               read=read_speed, write=write_speed)
+
+            if stop_event.is_set():
+                completed = False
+                break
+            # pause until the CPU time used by the scan is back
+            # within its share of the time the pass has taken
+            cpu_time = time.thread_time() - start_cpu_time
+            ahead = cpu_time / self.max_cpu_share - \
+                (time.monotonic() - start)
+            if ahead > self.min_pause:
+                stop_event.wait(ahead)
+
+        # processes are only known to have exited after a full pass
+        if completed:
+            for key in self._table.keys() - seen:
+                self._remove_entry(key)
+            self._denied = denied
+        else:
+            self._denied |= denied
+        self.n_denied = len(self._denied)
+
+        return {name: {tag: totals[tag] for tag in self.tags}
+                for name, totals in self._totals.items()}
+
+
+class CgroupTracker(ContributorTracker):
+    """
+    Tracks the cpu and RAM usage of every leaf cgroup of the cgroup v2
+    hierarchy, e. g. systemd services or containers.
+    Only works if `cgroups.is_available()` is true.
+    """
+    def __init__(self):
+        super(CgroupTracker, self).__init__()
+        self._reader = cgroups.CgroupReader()
+
+    def stop(self):
+        # a scan which is still running may still need the files
+        if super(CgroupTracker, self).stop():
+            self._reader.close()
+
+    def _scan(self, stop_event):
+        return self._reader.read(time.monotonic())
+
+
+def get_contributor_tracker(mode):
+    """
+    Get the tracker class for the ``contributors`` setting of a stat,
+    which is either ``processes`` or ``cgroups``.
+    """
+    if mode == 'cgroups':
+        if cgroups.is_available():
+            return CgroupTracker
+        logging.warning('The cgroup v2 hierarchy is not available. '
+                        'Falling back to process contributors.')
+    elif mode != 'processes':
+        logging.warning(f'Unknown contributor mode "{mode}". '
+                        'Falling back to process contributors.')
+    return ProcessTracker
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=ContributorTracker._reset)
@@ -38,9 +38,16 @@ class JupyterRAMUsage(Stat):
     Note that RAM tracked in this way is not equal to the actual RAM
     the OS needs because some further optimization is done by e. g. numpy
     to reduce the OS memory usage.
+
+    Polled once per second by default because the notebook does not
+    update the RAM usage more often with the default settings.
     """
     name = 'RAM Usage of objects in a Python Jupyter Notebook [MB]'
     base_tag = 'ram_usage'
+    has_contributor_breakdown = True
+    default_sample_interval = 1.
+    # the notebook may take a while to answer
+    default_deadline = 1.
     default_settings = {
         'connection info': '',
         # how often the memory usage is read in the jupyter notebook
@@ -133,13 +140,15 @@ _permon_running = False
 """
         self.client = BlockingKernelClient()
         self.client.load_connection_info(self.config)
+        super(JupyterRAMUsage, self).__init__(fps=fps)
+
+    def start(self):
         self.client.start_channels()
         self.client.execute(self.setup_code)
-        super(JupyterRAMUsage, self).__init__(fps=fps)
 
-    def __del__(self):
+    def stop(self):
         # stop the thread running in the jupyter notebook
-        # and stop the connection to the kernel upon deletion
+        # and stop the connection to the kernel
         self.client.execute(self.teardown_code)
         self.client.stop_channels()
 
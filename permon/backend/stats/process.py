@@ -0,0 +1,382 @@
+import os
+import re
+import time
+from abc import ABC
+import psutil
+from permon.backend import Stat, procfs
+from permon import exceptions
+
+
+class ProcessTree():
+    """
+    A target process and all of its children. The target is resolved once
+    from its pid or from a regular expression matched against the command
+    lines of all processes. Afterwards, only the processes in the tree are
+    read. Finding the children needs a look at every process, so they are
+    only updated every `children_interval` seconds.
+    """
+    children_interval = 1.
+
+    def __init__(self, pid=0, pattern=''):
+        self.root = self.find(pid, pattern)
+        # maps pids to the processes in the tree
+        self._processes = {}
+        self._children_timestamp = None
+        # maps pids to their I/O counters and the time they were read at
+        self._previous_io = {}
+
+    @staticmethod
+    def find(pid=0, pattern=''):
+        """
+        Get the process with `pid` or, if `pid` is 0, the oldest process
+        whose command line matches `pattern`.
+        Returns None if there is no such process.
+        """
+        if pid:
+            try:
+                return psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                return None
+
+        if pattern:
+            regex = re.compile(pattern)
+            matches = []
+            for proc in psutil.process_iter(['cmdline', 'create_time']):
+                # the command line of processes of other users may be None
+                cmdline = ' '.join(proc.info['cmdline'] or [])
+                if proc.pid != os.getpid() and regex.search(cmdline):
+                    matches.append(proc)
+            # the oldest match is usually the parent of the other ones
+            if matches:
+                return min(matches, key=lambda proc: proc.info['create_time'])
+        return None
+
+    def _update_children(self, timestamp):
+        if self._children_timestamp is not None and \
+                timestamp - self._children_timestamp < self.children_interval:
+            return
+        self._children_timestamp = timestamp
+
+        try:
+            processes = [self.root] + self.root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            processes = []
+
+        updated_processes = {}
+        for proc in processes:
+            # cpu_percent is measured since the previous call on the same
+            # object, so known processes keep their object. processes
+            # compare equal if they have the same pid and creation time
+            known_proc = self._processes.get(proc.pid)
+            updated_processes[proc.pid] = known_proc \
+                if known_proc == proc else proc
+        self._processes = updated_processes
+
+        for pid in self._previous_io.keys() - self._processes.keys():
+            del self._previous_io[pid]
+
+    def _get_io_speed(self, proc, timestamp):
+        """Get the bytes per second `proc` has read and written."""
+        try:
+            counters = proc.io_counters()
+        except (psutil.AccessDenied, AttributeError):
+            # io_counters does not exist on macOS
+            return 0.
+        total = counters.read_bytes + counters.write_bytes
+
+        previous = self._previous_io.get(proc.pid)
+        self._previous_io[proc.pid] = (total, timestamp)
+        if previous is None or timestamp <= previous[1]:
+            return 0.
+        return (total - previous[0]) / (timestamp - previous[1])
+
+    def read(self):
+        """
+        Get a dictionary mapping the pids of all processes in the tree to
+        their name, CPU usage in percent, RSS in bytes, disk I/O in bytes
+        per second and number of threads.
+        """
+        if self.root is None:
+            return {}
+
+        timestamp = time.monotonic()
+        self._update_children(timestamp)
+
+        values = {}
+        for pid, proc in self._processes.items():
+            try:
+                with proc.oneshot():
+                    values[pid] = {
+                        'name': proc.name(),
+                        'cpu': proc.cpu_percent(),
+                        'ram': proc.memory_info().rss,
+                        'io': self._get_io_speed(proc, timestamp),
+                        'threads': proc.num_threads()
+                    }
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # the process has exited or belongs to another user
+                continue
+        return values
+
+
+class ThreadReader():
+    """
+    Reads the CPU usage of every thread of a process from
+    /proc/<pid>/task/<tid>/stat. The stat file of every thread is kept
+    open, so a read costs one listing of the task directory and one pread
+    per thread instead of a psutil object per thread.
+    """
+    def __init__(self, pid):
+        self.task_dir = f'/proc/{pid}/task'
+        # maps tids to their open stat file
+        self._files = {}
+        # maps tids to their CPU time in clock ticks and the time it has
+        # been read at
+        self._previous_times = {}
+        self._ticks_per_second = os.sysconf('SC_CLK_TCK')
+
+    def _close(self, tid):
+        self._files.pop(tid).close()
+        self._previous_times.pop(tid, None)
+
+    def read(self, timestamp):
+        """
+        Get a list of (name, tid, CPU usage in percent) tuples of every
+        thread since the previous read. `timestamp` is the monotonic time
+        of the read.
+        """
+        try:
+            tids = os.listdir(self.task_dir)
+        except OSError:
+            # the process has exited
+            tids = []
+        for tid in self._files.keys() - set(tids):
+            self._close(tid)
+
+        threads = []
+        for tid in tids:
+            try:
+                if tid not in self._files:
+                    self._files[tid] = procfs.ProcFile(
+                        os.path.join(self.task_dir, tid, 'stat'))
+                data = self._files[tid].read()
+            except OSError:
+                # the thread has exited since the directory was listed
+                if tid in self._files:
+                    self._close(tid)
+                continue
+
+            # the name is in parentheses and may contain any character
+            name_start = data.index(b'(') + 1
+            name_end = data.rindex(b')')
+            name = data[name_start:name_end].decode(errors='replace')
+            # the fields after the name start with the state, utime and
+            # stime are the 14th and 15th field of the whole line
+            fields = data[name_end + 2:].split()
+            cpu_time = int(fields[11]) + int(fields[12])
+
+            cpu_percent = 0.
+            if tid in self._previous_times:
+                previous_time, previous_timestamp = self._previous_times[tid]
+                if timestamp > previous_timestamp:
+                    cpu_percent = (cpu_time - previous_time) / \
+                        self._ticks_per_second / \
+                        (timestamp - previous_timestamp) * 100
+            self._previous_times[tid] = (cpu_time, timestamp)
+            threads.append((name, int(tid), cpu_percent))
+        return threads
+
+    def close(self):
+        for tid in list(self._files):
+            self._close(tid)
+
+
+class TargetProcessStat(Stat, ABC):
+    """
+    Base class for stats of a target process and its children, which
+    are the contributors. Only the processes in the tree are read.
+    """
+    has_contributor_breakdown = True
+    default_settings = {
+        'pid': 0,
+        'command pattern': ''
+    }
+    # the key of the value in the dictionaries returned by ProcessTree.read
+    key = None
+    scale = 1.
+
+    @classmethod
+    def check_availability(cls):
+        pid = cls.settings['pid']
+        pattern = cls.settings['command pattern']
+        if not pid and not pattern:
+            raise exceptions.StatNotAvailableError(
+                'Neither a pid nor a command pattern is set.')
+        if ProcessTree.find(pid, pattern) is None:
+            raise exceptions.StatNotAvailableError(
+                'The target process is not running.')
+
+    def start(self):
+        self.tree = ProcessTree(self.settings['pid'],
+                                self.settings['command pattern'])
+
+    def get_stat(self):
+        contributors = [(f'{values["name"]} ({pid})',
+                         values[self.key] * self.scale)
+                        for pid, values in self.tree.read().items()]
+        contributors = sorted(contributors, key=lambda x: x[1],
+                              reverse=True)
+
+        return sum(x[1] for x in contributors), contributors[:5]
+
+    @property
+    def minimum(self):
+        return 0
+
+    @property
+    def maximum(self):
+        return None
+
+
+class ProcessCPUStat(TargetProcessStat):
+    """
+    tag: ``process.cpu_usage``
+
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "pid": 0,
+            "command pattern": ""
+        }
+
+    Tracks the CPU usage of one process and its children.
+    The target is the process with ``pid``, or if ``pid`` is 0, the
+    oldest process whose command line matches the regular expression
+    ``command pattern``.
+    """
+    name = 'CPU Usage of a Process [%]'
+    base_tag = 'cpu_usage'
+    key = 'cpu'
+
+    @property
+    def maximum(self):
+        return 100 * psutil.cpu_count()
+
+
+class ProcessRAMStat(TargetProcessStat):
+    """
+    tag: ``process.ram_usage``
+
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "pid": 0,
+            "command pattern": ""
+        }
+
+    Tracks the resident memory of one process and its children.
+    See :class:`ProcessCPUStat` for the settings.
+    """
+    name = 'RAM Usage of a Process [MB]'
+    base_tag = 'ram_usage'
+    key = 'ram'
+    scale = 1 / 1000**2
+
+
+class ProcessIOStat(TargetProcessStat):
+    """
+    tag: ``process.io_speed``
+
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "pid": 0,
+            "command pattern": ""
+        }
+
+    Tracks the disk reads and writes of one process and its children.
+    See :class:`ProcessCPUStat` for the settings.
+    """
+    name = 'Disk I/O of a Process [MB / s]'
+    base_tag = 'io_speed'
+    key = 'io'
+    scale = 1 / 1000**2
+
+
+class ProcessThreadStat(TargetProcessStat):
+    """
+    tag: ``process.threads``
+
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "pid": 0,
+            "command pattern": ""
+        }
+
+    Tracks the number of threads of one process and its children.
+    See :class:`ProcessCPUStat` for the settings.
+    """
+    name = 'Threads of a Process'
+    base_tag = 'threads'
+    key = 'threads'
+
+
+class ThreadCPUStat(TargetProcessStat):
+    """
+    tag: ``process.thread_cpu_usage``
+
+    settings:
+
+    .. code-block:: javascript
+
+        {
+            "pid": 0,
+            "command pattern": ""
+        }
+
+    Tracks the CPU usage of one process. The contributors are its
+    threads, which helps to find the busiest thread pool of a service.
+    Children are not included. Only available on Linux.
+    See :class:`ProcessCPUStat` for the settings.
+    """
+    name = 'CPU Usage per Thread of a Process [%]'
+    base_tag = 'thread_cpu_usage'
+
+    @classmethod
+    def check_availability(cls):
+        if not procfs.is_available():
+            raise exceptions.StatNotAvailableError(
+                'Threads can only be read from /proc on Linux.')
+        super(ThreadCPUStat, cls).check_availability()
+
+    def start(self):
+        root = ProcessTree.find(self.settings['pid'],
+                                self.settings['command pattern'])
+        self.reader = ThreadReader(root.pid) if root is not None else None
+
+    def stop(self):
+        if self.reader is not None:
+            self.reader.close()
+
+    def get_stat(self):
+        if self.reader is None:
+            return 0., []
+
+        threads = self.reader.read(time.monotonic())
+        contributors = sorted(((f'{name} ({tid})', cpu_percent)
+                               for name, tid, cpu_percent in threads),
+                              key=lambda x: x[1], reverse=True)
+        return sum(x[1] for x in contributors), contributors[:5]
+
+    @property
+    def maximum(self):
+        return 100 * psutil.cpu_count()
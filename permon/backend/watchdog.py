@@ -0,0 +1,200 @@
+import threading
+import queue
+import time
+import logging
+import concurrent.futures
+from permon.backend import aio
+
+# the states a stat can be in
+OK = 'ok'
+# the last call missed its deadline, the last good value is used
+STALE = 'stale'
+# the stat timed out repeatedly and is not called for some time
+BACKING_OFF = 'backing off'
+# the stat timed out too often and is not called anymore
+DISABLED = 'disabled'
+
+
+class _Worker(threading.Thread):
+    """
+    Daemon thread running submitted functions one after another.
+    It is a daemon so that a hung call can not keep the interpreter alive.
+    """
+    def __init__(self, name):
+        super(_Worker, self).__init__(name=name, daemon=True)
+        self._queue = queue.Queue()
+
+    def submit(self, function):
+        future = concurrent.futures.Future()
+        self._queue.put((function, future))
+        return future
+
+    def stop(self):
+        self._queue.put(None)
+
+    def run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            function, future = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(function())
+                except BaseException as e:
+                    future.set_exception(e)
+            # do not keep the function alive while waiting for the next
+            # item, it would keep the stat from being deleted
+            del item, function, future
+
+
+class _AsyncWorker():
+    """
+    Runs submitted coroutine functions on the event loop shared by all
+    async stats. Calls of different stats run concurrently on the loop,
+    so no thread is needed per stat.
+    """
+    def submit(self, function):
+        return aio.submit(function)
+
+    def stop(self):
+        pass
+
+
+class Watchdog():
+    """
+    Calls `get_stat` of a stat instance in a worker thread and waits at most
+    until the deadline of the stat for the result. If `get_stat` is a
+    coroutine function, it runs on the event loop of async stats instead. If the deadline is missed,
+    the last good result is returned and marked as stale.
+
+    A call is started with `request` and its result is fetched with
+    `collect`. The deadline counts from the request, so the calls of
+    multiple stats requested at once run concurrently and waiting for all
+    of them takes at most as long as the longest deadline.
+
+    A stat which misses `max_timeouts` deadlines in a row is not called for
+    a backoff time which doubles with every further timeout up to
+    `max_backoff` seconds. After `disable_after` timeouts in a row,
+    the stat is disabled.
+    """
+    def __init__(self, stat, max_timeouts=3, max_backoff=60.,
+                 disable_after=10, clock=time.monotonic):
+        self.stat = stat
+        self.max_timeouts = max_timeouts
+        self.max_backoff = max_backoff
+        self.disable_after = disable_after
+        self.clock = clock
+
+        self.status = OK
+        self.n_timeouts = 0
+        self._result = None
+        self._future = None
+        self._requested = False
+        self._request_timestamp = None
+        self._collect_by = None
+        self._backoff_until = None
+
+        if aio.is_async(stat.get_stat):
+            self._worker = _AsyncWorker()
+        else:
+            self._worker = _Worker(name=f'permon-{stat.tag}')
+            self._worker.start()
+
+    @property
+    def deadline(self):
+        """
+        Get the time in seconds a call to `get_stat` may take.
+        If the stat does not set a deadline, it is half a frame.
+        """
+        if self.stat.deadline is None:
+            return .5 / self.stat.fps
+        return self.stat.deadline
+
+    def _on_timeout(self, timestamp):
+        self.n_timeouts += 1
+
+        if self.n_timeouts >= self.disable_after:
+            self.status = DISABLED
+            logging.error(f'{self.stat.tag} timed out {self.n_timeouts} '
+                          'times in a row and has been disabled.')
+        elif self.n_timeouts >= self.max_timeouts:
+            backoff = min(2 ** (self.n_timeouts - self.max_timeouts),
+                          self.max_backoff)
+            self._backoff_until = timestamp + backoff
+            self.status = BACKING_OFF
+            logging.warning(f'{self.stat.tag} timed out {self.n_timeouts} '
+                            f'times in a row. Backing off for {backoff}s.')
+        else:
+            self.status = STALE
+
+    def request(self, timestamp):
+        """
+        Start a call to `get_stat` in the worker thread. No call is started
+        if the stat is disabled, backing off or still busy with a call
+        from a previous tick.
+        """
+        self._requested = False
+        self._request_timestamp = timestamp
+
+        if self.status == DISABLED:
+            return
+        if self._backoff_until is not None and \
+                timestamp < self._backoff_until:
+            return
+
+        if self._future is not None:
+            # a call from a previous tick is still running
+            if not self._future.done():
+                self._on_timeout(timestamp)
+                return
+            # it finished after its deadline, so keep its result
+            # but do not count it as recovered
+            future, self._future = self._future, None
+            self._result = future.result()
+
+        self._future = self._worker.submit(self.stat.get_stat)
+        self._collect_by = self.clock() + self.deadline
+        self._requested = True
+
+    def collect(self):
+        """
+        Wait until the deadline of the last request for its result.
+        Get the result and whether it is stale. The result is None
+        if the stat has not returned a result yet.
+        """
+        if not self._requested:
+            return self._result, True
+        self._requested = False
+
+        timeout = max(self._collect_by - self.clock(), 0)
+        try:
+            result = self._future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            self._on_timeout(self._request_timestamp)
+            return self._result, True
+
+        self._future = None
+        self._result = result
+        self._backoff_until = None
+        self.n_timeouts = 0
+        self.status = OK
+        return result, False
+
+    def get_stat(self, timestamp):
+        """
+        Call `get_stat` and wait for the result.
+        Get the result and whether it is stale.
+        """
+        self.request(timestamp)
+        return self.collect()
+
+    def stop(self):
+        """
+        Stop the worker thread once the current call is finished.
+        A call which has not started yet is cancelled.
+        """
+        if self._future is not None:
+            self._future.cancel()
+        self._worker.stop()
@@ -57,9 +57,18 @@ def parse_stats(stats):
     for i in range(len(stats)):
         if isinstance(stats[i], str):
             stats[i] = {
-                'tag': stats[i],
-                'settings': {}
+                'tag': stats[i]
             }
+        # fill in the defaults of keys which are not given
+        # a sample interval, deadline or isolation of None means
+        # the default of the stat is used
+        stats[i] = {
+            'settings': {},
+            'sample interval [s]': None,
+            'deadline [s]': None,
+            'isolated': None,
+            **stats[i]
+        }
     return stats[0] if is_one else stats
 
 
@@ -1,11 +1,16 @@
 import os
 import sys
+import math
+import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from importlib import util
 import logging
 from permon import exceptions, backend, config
+from permon.backend import sampling, watchdog, isolation
+from permon.frontend import utils
 import subprocess
+import numpy as np
 
 
 class Monitor(ABC):
@@ -14,8 +19,15 @@ class Monitor(ABC):
     A monitor wraps a stat by adding a way to display it.
     """
     def __init__(self, stat, buffer_size, fps, color, app):
+        self.stat_class = stat
         # the only place a stat is ever instantiated
-        self.stat = stat(fps=fps)
+        if stat.isolated and isolation.is_available():
+            # the stat runs in a worker process, only its latest
+            # sample is read in this process
+            self.stat = isolation.ProcessStat(stat, fps=fps)
+        else:
+            self.stat = stat(fps=fps)
+        self.stat.start()
 
         if self.stat.minimum is not None and self.stat.maximum is not None:
             assert abs(self.stat.maximum - self.stat.minimum) > 0, \
@@ -24,19 +36,204 @@ class Monitor(ABC):
         self.buffer_size = buffer_size
         self.fps = fps
         self.color = color
+        # the history of the stat. unknown history is filled with the
+        # minimum value (or 0 if it is unknown)
+        self.history = utils.RingBuffer(
+            buffer_size, len(self.stat.labels) if self.stat.is_vector
+            else None, fill=self.stat.minimum or 0.)
+        # the history at lower resolutions to cover long time spans
+        self.rollup = utils.Rollup(
+            len(self.stat.labels) if self.stat.is_vector else None)
         self.app = app
+        self._last_poll = None
+        self._latest = None
+        self._requested = False
+        # the time of the tick the monitor has last been updated at
+        self.timestamp = None
+        # calls to the stat are made through a watchdog so that a
+        # hung stat can not freeze the frontend
+        self.watchdog = watchdog.Watchdog(self.stat)
+        self.status = watchdog.OK
+        self.stale = False
+
+    def request(self, timestamp):
+        """
+        Start polling the stat if its sample interval has passed since
+        the last poll. The call runs in the background until it is
+        collected by `poll`.
+        """
+        if self._requested:
+            return
+
+        interval = self.stat.sample_interval or 0
+        # allow half a frame of jitter so that polls stay on
+        # the nearest frame
+        is_due = self._last_poll is None or \
+            timestamp - self._last_poll >= interval - .5 / self.fps
+
+        if is_due:
+            self.watchdog.request(timestamp)
+            self._requested = True
+            self._last_poll = timestamp
+
+    def poll(self, timestamp):
+        """
+        Get the latest `Sample` of the stat.
+        The stat is only polled once its sample interval has passed since
+        the last poll. In between, the last value is held.
+        If the stat misses its deadline, the last good value is returned
+        and `self.stale` is set.
+        """
+        self.request(timestamp)
+
+        if self._requested:
+            self._requested = False
+            result, self.stale = self.watchdog.collect()
+            self.status = self.watchdog.status
+
+            if result is None:
+                # the stat has never returned in time
+                self._latest = self.stat.empty_sample()
+            else:
+                self._latest = self.stat.make_sample(result)
+
+        return self._latest
+
+    def missed_ticks(self, timestamp):
+        """
+        Get the number of ticks which have been skipped between the last
+        update and `timestamp`. Frontends fill them with the held value
+        so that the history stays evenly spaced in time.
+        """
+        if self.timestamp is None:
+            return 0
+        n_missed = round((timestamp - self.timestamp) * self.fps) - 1
+        return min(max(n_missed, 0), self.buffer_size)
+
+    def record(self, value, timestamp):
+        """
+        Add `value` captured at the tick `timestamp` to the history and
+        the rollup tiers. Returns the number of skipped ticks which have
+        been filled with the previous value.
+        """
+        n_missed = self.missed_ticks(timestamp)
+        self.history.append(value, n_missed)
+        self.rollup.add(value, timestamp)
+        self.timestamp = timestamp
+        return n_missed
+
+    def get_history(self, span, n_points):
+        """
+        Get the minimum, maximum and mean of the last `span` seconds in
+        at most `n_points` bins, see `utils.downsample_buckets`. Spans
+        which fit in the history are read from it, longer ones from the
+        finest rollup tier covering them.
+        """
+        end = self.timestamp
+        if end is None:
+            end = 0.
+        start = end - span
+
+        if span <= self.buffer_size / self.fps:
+            values = self.history.values
+            timestamps = end - np.arange(len(values))[::-1] / self.fps
+            buckets = (timestamps, values, values, values,
+                       np.ones(len(values)))
+        else:
+            buckets = self.rollup.get_tier(span).buckets()
+        return utils.downsample_buckets(*buckets, start, end, n_points)
 
     def remove(self):
         self.app.remove_monitor(self)
 
+    def stop(self):
+        """
+        Stop the thread calling the stat and everything the stat has
+        started, e. g. threads or its worker process.
+        """
+        self.watchdog.stop()
+        self.stat.stop()
+
     @abstractmethod
-    def update(self):
+    def update(self, timestamp):
         """
         Update the monitor by i. e. fetching the latest value from its stat.
+        `timestamp` is the monotonic time of the tick the value
+        is captured at.
         """
         pass
 
 
+class Scheduler():
+    """
+    Fires ticks on absolute deadlines spaced `1 / fps` apart.
+    The deadlines do not drift with the time the work of a tick takes.
+    When the process falls behind, missed ticks are skipped
+    instead of being fired in a burst.
+    """
+    def __init__(self, fps, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 1 / fps
+        self.clock = clock
+        self.sleep = sleep
+        self.n_skipped = 0
+        self._deadline = None
+
+    def next_deadline(self):
+        """
+        Get the deadline of the next tick. If deadlines have been missed,
+        only the latest of them is kept.
+        """
+        now = self.clock()
+        if self._deadline is None:
+            self._deadline = now
+
+        n_missed = math.floor((now - self._deadline) / self.interval)
+        if n_missed > 0:
+            self._deadline += n_missed * self.interval
+            self.n_skipped += n_missed
+        return self._deadline
+
+    def delay(self):
+        """Get the time in seconds until the next tick is due."""
+        return max(self.next_deadline() - self.clock(), 0)
+
+    def fire(self):
+        """
+        Fire the next tick without waiting for it and return its deadline.
+        Used by event loops which do their own waiting.
+        """
+        deadline = self.next_deadline()
+        self._deadline = deadline + self.interval
+        return deadline
+
+    def wait(self):
+        """Sleep until the next tick is due and return its deadline."""
+        delay = self.delay()
+        if delay > 0:
+            self.sleep(delay)
+        return self.fire()
+
+    def __iter__(self):
+        while True:
+            yield self.wait()
+
+
+class FastScheduler(Scheduler):
+    """
+    Fires ticks without waiting. The deadlines are still spaced
+    `1 / fps` apart starting at the current time, so frontends see
+    evenly spaced ticks which run ahead of the clock.
+    Used to replay recordings as fast as possible.
+    """
+    def next_deadline(self):
+        if self._deadline is None:
+            self._deadline = self.clock()
+        return self._deadline
+
+    def delay(self):
+        return 0
+
+
 class MonitorApp(ABC):
     """
     Base class for all monitor apps.
@@ -82,6 +279,7 @@ class MonitorApp(ABC):
         self.buffer_size = buffer_size
         self.fps = fps
         self.monitors = []
+        self.scheduler = Scheduler(fps)
 
         if len(self.initial_stats) == 0:
             raise exceptions.NoStatError()
@@ -92,7 +290,7 @@ class MonitorApp(ABC):
 
     def get_displayed_stats(self):
         """Get all stat classes that are currently displayed."""
-        return [type(monitor.stat) for monitor in self.monitors]
+        return [monitor.stat_class for monitor in self.monitors]
 
     def get_not_displayed_stats(self):
         """
@@ -131,13 +329,7 @@ class MonitorApp(ABC):
             tags = [x['tag'] for x in config.parse_stats(stats)]
 
             if stat.tag not in tags:
-                if stat.settings == stat.default_settings:
-                    stats.append(stat.tag)
-                else:
-                    stats.append({
-                        'tag': stat.tag,
-                        'settings': stat.settings
-                    })
+                stats.append(stat.get_repr())
             config.set_config({
                 'stats': stats
             })
@@ -170,10 +362,44 @@ class MonitorApp(ABC):
         """
         pass
 
-    def update(self):
-        """Update the app by updating every monitor."""
+    def update(self, timestamp=None):
+        """
+        Update the app by updating every monitor.
+        All monitors share one tick of the sampling hub so that sources
+        needed by multiple stats are only read once.
+        `timestamp` is the time of the tick, it defaults to the current
+        time and is the same for the hub and every monitor.
+        """
+        if timestamp is None:
+            timestamp = self.scheduler.clock()
+
+        with sampling.hub.tick(timestamp):
+            # start all calls before waiting for any of them so that they
+            # run concurrently and a tick is delayed by at most the
+            # longest deadline
+            for monitor in self.monitors:
+                monitor.request(timestamp)
+            for monitor in self.monitors:
+                monitor.update(timestamp)
+
+    def stop_monitors(self):
+        """
+        Stop all monitors. Must be called before the app quits, stats
+        are not stopped when they are garbage collected.
+        """
         for monitor in self.monitors:
-            monitor.update()
+            monitor.stop()
+
+    def update_forever(self, is_stopped=lambda: False):
+        """
+        Update the app on every tick of the scheduler
+        until `is_stopped` returns true. Every tick is stamped
+        with its deadline.
+        """
+        for deadline in self.scheduler:
+            if is_stopped():
+                break
+            self.update(deadline)
 
     @property
     def stats(self):
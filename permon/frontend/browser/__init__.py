@@ -2,12 +2,13 @@ from urllib import parse
 import webbrowser
 import json
 import threading
-import time
 import logging
 import bisect
 import secrets
-from permon.frontend import MonitorApp, Monitor
+from permon.frontend import MonitorApp, Monitor, Scheduler
+from permon.frontend import utils as frontend_utils
 from permon import backend, exceptions, security, config
+from permon.backend import watchdog
 
 # these modules will be imported later because flask
 # might not be installed
@@ -37,32 +38,65 @@ class BrowserMonitor(Monitor):
     """
     def __init__(self, *args, **kwargs):
         super(BrowserMonitor, self).__init__(*args, **kwargs)
-        self.values = []
         self.value = 0
         self.contributors = {}
+        # maps numbers of points to the downsampled history
+        # of the tick `_downsampled_at`
+        self._downsampled = {}
+        self._downsampled_at = None
 
-    def update(self):
-        if self.stat.has_contributor_breakdown:
-            value, contributors = self.stat.get_stat()
-        else:
-            value = self.stat.get_stat()
-            contributors = {}
+    def update(self, timestamp):
+        sample = self.poll(timestamp)
 
-        self.value = value
-        self.contributors = contributors
+        self.record(sample.value, timestamp)
+        self.contributors = sample.contributors
 
-        self.values.append(self.value)
-        if len(self.values) > self.buffer_size:
-            del self.values[0]
+        if self.stat.is_vector:
+            # the value is sent as JSON, so convert it to a list once
+            self.value = sample.value.tolist()
+        else:
+            self.value = sample.value
+
+    def get_downsampled_history(self, n_points):
+        """
+        Get the history reduced to `n_points` with LTTB downsampling.
+        The result is cached until the next sample is recorded.
+        """
+        if self._downsampled_at != self.timestamp:
+            self._downsampled = {}
+            self._downsampled_at = self.timestamp
+        if n_points in self._downsampled:
+            return self._downsampled[n_points]
+
+        values = self.history.values
+        # the rows of vector stats are chosen by their mean
+        indices = frontend_utils.lttb_indices(
+            values.mean(axis=1) if self.stat.is_vector else values,
+            n_points)
+        history = values[indices].tolist()
+        self._downsampled[n_points] = history
+        return history
+
+    def get_json_info(self, n_points=None):
+        """
+        Get info about the stat. If `n_points` is set, the history is
+        downsampled to at most `n_points`.
+        """
+        if n_points:
+            history = self.get_downsampled_history(n_points)
+        else:
+            history = self.history.values.tolist()
 
-    def get_json_info(self):
         return {
             'color': self.color,
             'minimum': self.stat.minimum,
             'maximum': self.stat.maximum,
             'tag': self.stat.tag,
             'name': self.stat.name,
-            'history': self.values,
+            # the names of the elements of vector stats
+            'labels': self.stat.labels if self.stat.is_vector else None,
+            'history': history,
+            'status': self.status,
         }
 
 
@@ -122,10 +156,32 @@ class BrowserApp(MonitorApp):
         return flask.Response('Wrong password or login token.', status=401)
 
     def _get_stat(self):
-        stat_info = [monitor.get_json_info() for monitor in self.monitors]
+        # clients can ask for the history at the width of their charts
+        n_points = flask.request.args.get('points', type=int)
+        stat_info = [monitor.get_json_info(n_points)
+                     for monitor in self.monitors]
         return flask.Response(json.dumps(stat_info),
                               mimetype='application/json')
 
+    def _get_history(self):
+        args = flask.request.args
+        try:
+            span = float(args['span'])
+            n_points = int(args['points'])
+        except (KeyError, ValueError):
+            return flask.Response('span and points must be numbers.',
+                                  status=400)
+        if span <= 0 or n_points <= 0:
+            return flask.Response('span and points must be positive.',
+                                  status=400)
+
+        for monitor in self.monitors:
+            if monitor.stat.tag == args.get('tag'):
+                history = monitor.get_history(span, n_points)
+                return flask.Response(json.dumps(history),
+                                      mimetype='application/json')
+        return flask.Response('Stat is not displayed.', status=404)
+
     def _get_all_stats(self):
         info = {}
         for stat in backend.get_all_stats():
@@ -137,11 +193,17 @@ class BrowserApp(MonitorApp):
     def _get_stat_updates(self, ws):
         origin = ws.origin
         logging.info(f'{origin} connected')
+        # push updates on absolute deadlines so the rate does not drift
+        scheduler = Scheduler(self.fps, sleep=gevent.sleep)
         while not ws.closed:
+            scheduler.wait()
             if not flask_login.current_user.is_authenticated:
                 break
 
             stat_updates = dict()
+            # the status of stats which are not ok e. g. because they timed
+            # out. the key can not collide with a tag since it has no dot
+            stat_updates['status'] = dict()
             for monitor in self.monitors:
                 if monitor.contributors:
                     stat_updates[monitor.stat.tag] = [monitor.value,
@@ -149,6 +211,9 @@ class BrowserApp(MonitorApp):
                 else:
                     stat_updates[monitor.stat.tag] = monitor.value
 
+                if monitor.status != watchdog.OK:
+                    stat_updates['status'][monitor.stat.tag] = monitor.status
+
             # send updates about all currently displayed stats
             try:
                 ws.send(json.dumps(stat_updates))
@@ -156,8 +221,6 @@ class BrowserApp(MonitorApp):
                 logging.info(f'{origin} disconnected')
                 ws.close()
 
-            gevent.sleep(1 / self.fps)
-
     def _add_stat_handler(self):
         data = flask.request.get_json()
         try:
@@ -207,11 +270,12 @@ class BrowserApp(MonitorApp):
     def remove_stat(self, stat, remove_from_config=True):
         monitor_of_stat = None
         for monitor in self.monitors:
-            if isinstance(monitor.stat, stat):
+            if monitor.stat_class is stat:
                 monitor_of_stat = monitor
 
         if monitor_of_stat is not None:
             self.monitors.remove(monitor_of_stat)
+            monitor_of_stat.stop()
             super(BrowserApp, self).remove_stat(
                 stat, remove_from_config=remove_from_config)
         else:
@@ -259,6 +323,8 @@ class BrowserApp(MonitorApp):
             ('/allStats', 'GET'): [flask_login.login_required,
                                    self._get_all_stats],
             ('/stats', 'GET'): [flask_login.login_required, self._get_stat],
+            ('/history', 'GET'): [flask_login.login_required,
+                                  self._get_history],
             ('/stats', 'DELETE'): [flask_login.login_required,
                                    self._remove_stat_handler],
             ('/stats', 'PUT'): [flask_login.login_required,
@@ -291,7 +357,8 @@ class BrowserApp(MonitorApp):
         server = gevent.pywsgi.WSGIServer((self.ip, self.port), self.app,
                                           handler_class=handler,
                                           log=logging_level, **ssl_args)
-        update_thread = threading.Thread(target=self.update_forever)
+        update_thread = threading.Thread(target=self.update_forever,
+                                         args=(lambda: self.stopped,))
         update_thread.start()
 
         protocol = 'https' if self.ssl_context else 'http'
@@ -312,13 +379,7 @@ class BrowserApp(MonitorApp):
 
         self.stopped = True
         update_thread.join()
-        # delete the monitors explicitly so that threads inside stats stop
-        del self.monitors
-
-    def update_forever(self):
-        while not self.stopped:
-            self.update()
-            time.sleep(1 / self.fps)
+        self.stop_monitors()
 
     def make_available(self):
         self.verify_installed('flask')
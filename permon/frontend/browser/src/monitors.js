@@ -162,7 +162,69 @@ export function setupSocket() {
   };
 }
 
+function setupHeatmap(stat) {
+  // vector stats are drawn as a heatmap strip with one row per element
+  // and one column per frame. the canvas has one pixel per cell and is
+  // stretched to the size of the chart
+  const {
+    tag, maximum, minimum, color, history, labels,
+  } = stat;
+
+  const chartContainer = document.getElementById(tag);
+  const heading = document.createElement('h2');
+  heading.textContent = stat.name;
+
+  const canvas = document.createElement('canvas');
+  canvas.classList.add('chart');
+  canvas.width = buffersize;
+  canvas.height = labels.length;
+  canvas.style.imageRendering = 'pixelated';
+  canvas.title = `${labels[0]} (top) to ${labels[labels.length - 1]} (bottom)`;
+
+  chartContainer.appendChild(heading);
+  chartContainer.appendChild(canvas);
+
+  const context = canvas.getContext('2d');
+  const rgb = [1, 3, 5].map(i => parseInt(color.slice(i, i + 2), 16));
+  const column = context.createImageData(1, labels.length);
+  let runningMax = maximum == null ? 0 : maximum;
+
+  function drawColumn(values, x) {
+    const min = minimum == null ? 0 : minimum;
+    if (maximum == null) {
+      runningMax = Math.max(runningMax, ...values);
+    }
+    const range = Math.max(runningMax - min, 1e-9);
+
+    values.forEach((value, i) => {
+      const level = Math.min(Math.max((value - min) / range, 0), 1);
+      column.data.set([...rgb, Math.round(level * 255)], i * 4);
+    });
+    context.putImageData(column, x, 0);
+  }
+
+  history.forEach((values, i) => drawColumn(values, buffersize - history.length + i));
+
+  function updateHeatmap() {
+    // move the strip one column to the left and draw the latest values
+    context.globalCompositeOperation = 'copy';
+    context.drawImage(canvas, -1, 0);
+    context.globalCompositeOperation = 'source-over';
+    drawColumn(currentData[tag] || Array(labels.length).fill(0), buffersize - 1);
+
+    // show the status of the stat if it is not ok e. g. because it timed out
+    const status = currentData.status && currentData.status[tag];
+    heading.textContent = status ? `${stat.name} (${status})` : stat.name;
+  }
+  updateFunctions.push(updateHeatmap);
+}
+
 export function setupMonitor(stat) {
+  if (stat.labels) {
+    setupHeatmap(stat);
+    return;
+  }
+
   const {
     tag, maximum, minimum, color, history,
   } = stat;
@@ -286,6 +348,10 @@ export function setupMonitor(stat) {
 
     data.push(makePoint(value));
 
+    // show the status of the stat if it is not ok e. g. because it timed out
+    const status = currentData.status && currentData.status[tag];
+    heading.textContent = status ? `${stat.name} (${status})` : stat.name;
+
     if (contributors) {
       // clear tickPositiions and labelPositions array
       tickPositions.length = 0;
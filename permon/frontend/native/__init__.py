@@ -1,5 +1,6 @@
 import sys
 import os
+import math
 import logging
 import signal
 from permon.frontend import Monitor, MonitorApp
@@ -29,20 +30,24 @@ class NativeMonitor(Monitor):
                  app, thickness):
         super(NativeMonitor, self).__init__(stat, buffer_size,
                                             fps, color, app)
-        self.value = 0
+        self.value = self.stat.empty_sample().value
+        if self.stat.is_vector:
+            # QML can not handle NumPy arrays
+            self.value = self.value.tolist()
+        self.n_missed = 0
         self.contributors = []
 
-    def update(self):
+    def update(self, timestamp):
         # every frame, we remove the last point of the history and
         # append a new measurement to the end
-        if self.stat.has_contributor_breakdown:
-            value, contributors = self.stat.get_stat()
-        else:
-            value = self.stat.get_stat()
-            contributors = []
+        sample = self.poll(timestamp)
 
-        self.value = value
-        self.contributors = contributors
+        self.n_missed = self.record(sample.value, timestamp)
+        if self.stat.is_vector:
+            self.value = sample.value.tolist()
+        else:
+            self.value = sample.value
+        self.contributors = sample.contributors
 
 
 class NativeApp(MonitorApp):
@@ -71,11 +76,12 @@ class NativeApp(MonitorApp):
     def remove_stat(self, stat, remove_from_config=True):
         monitor_of_stat = None
         for monitor in self.monitors:
-            if isinstance(monitor.stat, stat):
+            if monitor.stat_class is stat:
                 monitor_of_stat = monitor
 
         if monitor_of_stat is not None:
             self.monitor_model.removeMonitor(monitor_of_stat)
+            monitor_of_stat.stop()
             super(NativeApp, self).remove_stat(
                 stat, remove_from_config=remove_from_config)
         else:
@@ -151,15 +157,32 @@ class NativeApp(MonitorApp):
             os._exit(0)
 
         signal.signal(signal.SIGINT, signal_handler)
+
+        # the monitors are updated by a single shot timer which is
+        # rearmed to the next deadline of the scheduler after every tick
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._tick)
+        self.timer.start(0)
+
         view.show()
         self.qapp.exec_()
         self.quit()
 
+    def _tick(self):
+        # the timer must not block the GUI thread by sleeping,
+        # so if it fired early it is just rearmed
+        if self.scheduler.delay() <= 0:
+            self.update(self.scheduler.fire())
+            self.monitor_model.notifyUpdated()
+        # round up so the timer does not fire before the deadline
+        self.timer.start(math.ceil(self.scheduler.delay() * 1000))
+
     def quit(self):
-        # delete everything with a reference to monitors
-        # so that all stats are deleted, and possible threads
-        # they are using stopped
-        del self.monitors
+        self.timer.stop()
+        # stop all stats and the threads and processes they are using
+        self.stop_monitors()
         del self.settings_model
         del self.monitor_model
         self.qapp.exit()
@@ -91,7 +91,7 @@ Page {
             margins.left: 0
 
             Label {
-                text: model.name
+                text: model.status == "ok" ? model.name : model.name + " (" + model.status + ")"
                 topPadding: 10
                 // the left margin of charts depends on the font size (unfortunately)
                 // so the left paddding of the title label also has to depend on the same things as the font size
@@ -185,27 +185,51 @@ Page {
                 }
             }
 
-            Timer {
+            // the monitors are updated by the python side on the deadlines
+            // of its scheduler, the chart is updated after every update
+            Connections {
+                target: monitorModel
+                onUpdated: timer.update()
+            }
+
+            Item {
                 property int timeline: 0
                 property bool valueLabelsInitialized: false
                 property var values: []
+                property var lastValue: null
+                // vector stats have one series per element
+                property var vectorSeries: []
                 id: timer
-                interval: 1000 / model.fps
-                running: true
-                repeat: true
-                onTriggered: {
+                function push(value) {
                     timeline++;
-
-                    if(model.tag == null) {
-                        return;
+                    var scalar = value;
+                    if(model.labels) {
+                        for(var i = 0; i < value.length; i++) {
+                            vectorSeries[i].append(timeline, value[i]);
+                            vectorSeries[i].remove(0);
+                        }
+                        // the value axis and tooltip follow the largest element
+                        scalar = Math.max.apply(null, value);
                     }
-                    values.push(model.value);
+                    values.push(scalar);
                     values.shift();
                     series.append(timeline, values[model.bufferSize - 1]);
                     series.remove(0);
 
                     axisX.min++;
                     axisX.max++;
+                }
+                function update() {
+                    if(model.tag == null) {
+                        timeline++;
+                        return;
+                    }
+                    // ticks skipped by the python side hold the previous value
+                    for(var i = 0; i < model.missedTicks; i++) {
+                        push(lastValue);
+                    }
+                    push(model.value);
+                    lastValue = model.value;
 
                     // update tooltip
                     if(tooltip.visible) {
@@ -302,11 +326,20 @@ Page {
                     tooltip.text = formatValue(hoveredValue, hoveredValue);
                 }
                 Component.onCompleted: {
+                    if(model.labels) {
+                        series.visible = false;
+                        model.labels.forEach(function(label) {
+                            vectorSeries.push(chartView.createSeries(ChartView.SeriesTypeLine, label, axisX, valueAxis));
+                        });
+                    }
                     for(var i = 0; i < model.bufferSize; i++) {
                         values.push(0);
+                        vectorSeries.forEach(function(elementSeries) {
+                            elementSeries.append(timeline, 0);
+                        });
                         series.append(timeline++, 0);
                     }
-                    onTriggered();
+                    update();
                     if(valueAxis.min != null && valueAxis.max != null) {
                         refreshLabels(valueAxis.min, valueAxis.max);
                     }
@@ -11,15 +11,14 @@ class MonitorModel(QtCore.QAbstractListModel):
     Model to manage communication between QML and Python concerning
     adding and removing of monitors.
     """
+    # emitted after all monitors have been updated in a tick
+    updated = QtCore.Signal()
+
     def __init__(self, parent=None):
         super(MonitorModel, self).__init__(parent)
 
         self.monitors = []
 
-        def get_and_update_value(monitor):
-            monitor.update()
-            return monitor.value
-
         # determine which properties of a monitor are exposed to QML
         self.exposed_properties = {
             'tag': lambda monitor: monitor.stat.tag,
@@ -27,8 +26,13 @@ class MonitorModel(QtCore.QAbstractListModel):
             'maximum': lambda monitor: monitor.stat.maximum,
             'fps': lambda monitor: monitor.fps,
             'bufferSize': lambda monitor: monitor.buffer_size,
-            'value': get_and_update_value,
+            'value': lambda monitor: monitor.value,
+            # the names of the elements of vector stats
+            'labels': lambda monitor: monitor.stat.labels
+            if monitor.stat.is_vector else None,
+            'missedTicks': lambda monitor: monitor.n_missed,
             'contributors': lambda monitor: monitor.contributors,
+            'status': lambda monitor: monitor.status,
             'color': lambda monitor: monitor.color,
             'name': lambda monitor: monitor.stat.name,
         }
@@ -51,6 +55,16 @@ class MonitorModel(QtCore.QAbstractListModel):
         del self.monitors[monitor_index]
         self.endRemoveRows()
 
+    def notifyUpdated(self):
+        """Notify QML that the values of all monitors have changed."""
+        updated_keys = (b'value', b'missedTicks', b'contributors', b'status')
+        roles = [role for role, key in self._roles.items()
+                 if key in updated_keys]
+        if self.monitors:
+            self.dataChanged.emit(self.index(0),
+                                  self.index(len(self.monitors) - 1), roles)
+        self.updated.emit()
+
     def rowCount(self, parent=QtCore.QModelIndex()):
         return len(self.monitors)
 
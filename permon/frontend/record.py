@@ -0,0 +1,74 @@
+import time
+import logging
+from permon.frontend import MonitorApp, Monitor
+from permon.backend import recording
+
+
+class RecordMonitor(Monitor):
+    """
+    A monitor without a display. It only keeps the latest sample
+    of its stat, the app writes it to the recording.
+    """
+    def __init__(self, *args, **kwargs):
+        super(RecordMonitor, self).__init__(*args, **kwargs)
+        self.sample = self.stat.empty_sample()
+
+    def update(self, timestamp):
+        # the history is not needed, so the sample is not recorded in it
+        self.sample = self.poll(timestamp)
+        self.timestamp = timestamp
+
+
+class RecordApp(MonitorApp):
+    """
+    Samples stats on the scheduler without any UI and appends them to
+    a recording at `path`, see `permon.backend.recording`. Records until
+    it is interrupted or for `duration` seconds if it is set.
+    """
+    def __init__(self, stats, path, fps=None, duration=None):
+        fps = fps or 1
+        # the recording has no history and no colors
+        super(RecordApp, self).__init__(stats, colors=[None],
+                                        buffer_size=1, fps=fps)
+        self.path = path
+        self.duration = duration
+        self.writer = None
+        # rows are stamped with the wall clock time, ticks
+        # with the monotonic one
+        self.clock_offset = time.time() - self.scheduler.clock()
+
+    def update(self, timestamp=None):
+        if timestamp is None:
+            timestamp = self.scheduler.clock()
+
+        super(RecordApp, self).update(timestamp)
+        self.writer.append(timestamp + self.clock_offset,
+                           [monitor.sample for monitor in self.monitors])
+
+    def initialize(self):
+        start = self.scheduler.clock()
+
+        def is_stopped():
+            return self.duration is not None and \
+                self.scheduler.clock() - start >= self.duration
+
+        try:
+            for stat in self.initial_stats:
+                monitor = RecordMonitor(stat, buffer_size=1, fps=self.fps,
+                                        color=None, app=self)
+                self.monitors.append(monitor)
+
+            stats = [recording.describe(monitor.stat_class, monitor.stat)
+                     for monitor in self.monitors]
+            self.writer = recording.RecordingWriter(self.path, stats,
+                                                    self.fps)
+            logging.info(f'Recording to {self.path}')
+
+            self.update_forever(is_stopped)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop_monitors()
+            if self.writer is not None:
+                self.writer.close()
+                logging.info(f'Recorded {self.writer.n_rows} rows')
@@ -1,8 +1,9 @@
 import math
-import time
 import os
+import numpy as np
 from permon.frontend import Monitor, MonitorApp, utils
 from permon import exceptions
+from permon.backend import watchdog
 
 # blessings will be imported later if possible
 # because it is not available on windows
@@ -26,8 +27,8 @@ class TerminalMonitor(Monitor):
                                               fps, color, app)
         self.title = self.stat.name
         self.resolution = resolution
-        # fill unknown history with the minimum value (or 0 if it is unknown)
-        self.values = [self.stat.minimum or 0.] * buffer_size
+        # the shades of vector stats, from the minimum to the maximum
+        self.shades = ' ░▒▓█'
         self.symbols = {
             'axis': ' ┤',
             'right_axis': '├',
@@ -39,35 +40,91 @@ class TerminalMonitor(Monitor):
             'flat_then_rise': '╯'
         }
 
-    def update(self):
-        del self.values[0]
+    def update(self, timestamp):
+        sample = self.poll(timestamp)
 
-        if self.stat.has_contributor_breakdown:
-            value, contrib = self.stat.get_stat()
+        # ticks skipped since the last update hold the previous value
+        self.record(sample.value, timestamp)
+
+        self.latest_contrib = sample.contributors
+        if self.stat.is_vector:
+            self.paint_vector()
         else:
-            value = self.stat.get_stat()
-            contrib = {}
-        self.values.append(value)
-        self.latest_contrib = contrib
-        self.paint()
+            self.paint()
+
+    def get_title(self):
+        title = self.title
+        if self.status != watchdog.OK:
+            title += f' ({self.status})'
+        return title
+
+    def paint_vector(self):
+        """
+        Paint a vector stat as stacked rows, one per element. The shade of
+        a cell shows the value at that time. If there are more elements
+        than rows, neighbouring elements are averaged.
+        """
+        values = self.history.values
+        labels = self.stat.labels
+        height = self.resolution[0] - 1
+        width = values.shape[0]
+
+        minimum = self.stat.minimum
+        maximum = self.stat.maximum
+        if minimum is None:
+            minimum = self.history.min()
+        if maximum is None:
+            maximum = self.history.max()
+        interval = max(float(maximum - minimum), 1e-9)
+
+        groups = np.array_split(np.arange(len(labels)),
+                                min(len(labels), height))
+        rows = []
+        for group in groups:
+            if len(group) == 1:
+                label = labels[group[0]]
+            else:
+                label = f'{labels[group[0]]}-{labels[group[-1]]}'
+            label = utils.format_contributor_label(
+                label, max_len=self.axis_width - len(self.symbols['axis']))
+            label = label.rjust(self.axis_width - len(self.symbols['axis']))
+
+            group_values = values[:, group].mean(axis=1)
+            levels = np.clip((group_values - minimum) / interval, 0, 1)
+            indices = np.round(levels * (len(self.shades) - 1)).astype(int)
+            line = ''.join(self.shades[i] for i in indices)
+
+            latest = utils.format_labels([group_values[-1]])[0]
+            rows.append(label + self.symbols['axis'] +
+                        self.color(line) + ' ' +
+                        latest.ljust(self.r_axis_width - 1))
+        # keep the layout stable if there are less elements than rows
+        rows.extend([' ' * (self.axis_width + width + self.r_axis_width)] *
+                    (height - len(rows)))
+
+        print(self.color(self.get_title()))
+        print('\n'.join(rows))
 
     def paint(self):
+        values = self.history.values
         minimum = self.stat.minimum
         maximum = self.stat.maximum
 
         # if we dont know the min or max and they cant be determined by
         # the history, we have to set some defaults (e. g. -1 and 1)
-        range_is_zero = max(self.values) == min(self.values)
+        history_min = self.history.min()
+        history_max = self.history.max()
+        range_is_zero = history_max == history_min
         if minimum is None:
             if range_is_zero:
-                minimum = -self.values[0] - 1
+                minimum = -values[0] - 1
             else:
-                minimum = min(self.values)
+                minimum = history_min
         if maximum is None:
             if range_is_zero:
-                maximum = self.values[0] + 1
+                maximum = values[0] + 1
             else:
-                maximum = max(self.values)
+                maximum = history_max
 
         interval = float(abs(maximum - minimum))
         # we have to reserve 1 line for the chart title
@@ -83,7 +140,7 @@ class TerminalMonitor(Monitor):
         max_cell = int(math.ceil(round(maximum * ratio, 4)))
 
         rows = max(abs(max_cell - min_cell), 1)
-        width = len(self.values)
+        width = len(values)
 
         # utility function to determine which cell a value is best placed in
         def get_cell(value):
@@ -108,7 +165,7 @@ class TerminalMonitor(Monitor):
             contribs_row = [[name, value / maximum * rows]
                             for name, value in self.latest_contrib]
             used_rows = sum(math.floor(value) for _, value in contribs_row)
-            row_diff = get_cell(self.values[-1]) + 1 - used_rows
+            row_diff = get_cell(values[-1]) + 1 - used_rows
             for _ in range(row_diff):
                 max_dec_index = max(enumerate(contribs_row),
                                     key=lambda x: x[1][1] % 1)[0]
@@ -129,7 +186,7 @@ class TerminalMonitor(Monitor):
                     ' ' + utils.format_contributor_label(name,
                                                          max_len=max_label_len)
 
-                if len(contrib_axis) >= get_cell(self.values[-1]) + 1:
+                if len(contrib_axis) >= get_cell(values[-1]) + 1:
                     break
 
         unused_rows = len(axis) - len(contrib_axis)
@@ -143,9 +200,9 @@ class TerminalMonitor(Monitor):
         # create chart line
         line = [[' '] * width for i in range(rows + 1)]
 
-        for x in range(0, len(self.values) - 1):
-            value = get_cell(self.values[x])
-            next_value = get_cell(self.values[x + 1])
+        for x in range(0, len(values) - 1):
+            value = get_cell(values[x])
+            next_value = get_cell(values[x + 1])
 
             if value == next_value:
                 line[rows - value][x] = self.symbols['horizontal']
@@ -163,7 +220,7 @@ class TerminalMonitor(Monitor):
                     line[rows - y][x] = self.symbols['vertical']
 
         # title and line have the chart color, while the axis is always white
-        print(self.color(self.title))
+        print(self.color(self.get_title()))
         out_rows = [axis[i] +
                     self.color(''.join(line[i])) +
                     contrib_axis[i] if contrib_axis else ''
@@ -203,14 +260,16 @@ class TerminalApp(MonitorApp):
         print(self.term.hide_cursor())
 
         try:
-            while True:
-                print(self.term.move(0, 1))
-                self.update()
-                time.sleep(1 / self.fps)
+            self.update_forever()
         except KeyboardInterrupt:
             print(self.term.exit_fullscreen())
-            # explicitly delete monitors to stop threads run by stats
-            del self.monitors
+            self.stop_monitors()
+
+    def update(self, timestamp=None):
+        # move the cursor to the top so the monitors are painted
+        # over the previous frame
+        print(self.term.move(0, 1))
+        super(TerminalApp, self).update(timestamp)
 
     def make_available(self):
         if os.name == 'nt':
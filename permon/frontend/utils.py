@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def format_labels(axis_values):
     """
     Format the labels of an axis. Rounds the labels to some value based on the
@@ -26,3 +29,229 @@ def format_contributor_label(label, max_len=15):
     if len(label) > max_len:
         label = label[:max_len - len(fill)] + fill
     return label
+
+
+class RingBuffer():
+    """
+    The history of a stat with a fixed capacity of `size` ticks, backed
+    by a preallocated float64 array. Samples of vector stats with `length`
+    elements are stored as rows. Appending is O(1) and never moves the
+    history. Every row is written twice, at its position and `size` rows
+    later, so `values` is always a contiguous view without a copy.
+    """
+    def __init__(self, size, length=None, fill=0.):
+        shape = (2 * size,) if length is None else (2 * size, length)
+        self.size = size
+        self._buffer = np.full(shape, float(fill))
+        # the index of the oldest row
+        self._start = 0
+
+    def __len__(self):
+        return self.size
+
+    def _write(self, value):
+        self._buffer[self._start] = value
+        self._buffer[self._start + self.size] = value
+        self._start = (self._start + 1) % self.size
+
+    def append(self, value, n_missed=0):
+        """
+        Append `value` to the history. `n_missed` skipped ticks are
+        inserted before it which hold the previous value.
+        """
+        if n_missed > 0:
+            previous = self.latest.copy()
+            for _ in range(min(n_missed, self.size)):
+                self._write(previous)
+        self._write(value)
+
+    @property
+    def values(self):
+        """The history with the oldest sample first. Must not be changed."""
+        return self._buffer[self._start:self._start + self.size]
+
+    @property
+    def latest(self):
+        return self._buffer[self._start + self.size - 1]
+
+    def min(self):
+        return self.values.min()
+
+    def max(self):
+        return self.values.max()
+
+
+class RollupTier():
+    """
+    The history of a stat aggregated into buckets of `period` seconds.
+    The minimum, maximum, mean and number of samples of the last `size`
+    buckets are kept in ring buffers. The bucket which is currently
+    filled is kept separately until a sample of a later bucket arrives.
+    """
+    def __init__(self, period, size, length=None):
+        self.period = period
+        self.starts = RingBuffer(size, fill=np.nan)
+        self.minimum = RingBuffer(size, length, fill=np.nan)
+        self.maximum = RingBuffer(size, length, fill=np.nan)
+        self.mean = RingBuffer(size, length, fill=np.nan)
+        self.count = RingBuffer(size)
+        # start, minimum, maximum, sum and count of the open bucket
+        self._open = None
+
+    def _close(self):
+        start, minimum, maximum, total, count = self._open
+        self._open = None
+
+        mean = total / count
+        self.starts.append(start)
+        self.minimum.append(minimum)
+        self.maximum.append(maximum)
+        self.mean.append(mean)
+        self.count.append(count)
+        return start, minimum, maximum, mean, count
+
+    def add(self, timestamp, minimum, maximum, mean, count):
+        """
+        Add an aggregate of `count` samples taken at `timestamp`.
+        Returns the (start, minimum, maximum, mean, count) aggregate of
+        the bucket closed by it or None if the open bucket continues.
+        """
+        start = timestamp // self.period * self.period
+        closed = None
+        if self._open is not None and start != self._open[0]:
+            closed = self._close()
+
+        if self._open is None:
+            self._open = [start, np.array(minimum, dtype=float),
+                          np.array(maximum, dtype=float),
+                          np.multiply(mean, count, dtype=float), count]
+        else:
+            bucket = self._open
+            bucket[1] = np.minimum(bucket[1], minimum)
+            bucket[2] = np.maximum(bucket[2], maximum)
+            bucket[3] = bucket[3] + np.multiply(mean, count)
+            bucket[4] += count
+        return closed
+
+    def buckets(self):
+        """
+        Get the starts, minima, maxima, means and counts of all buckets
+        including the open one with the oldest bucket first.
+        Buckets which have never been filled have a count of zero.
+        """
+        buckets = [self.starts.values, self.minimum.values,
+                   self.maximum.values, self.mean.values, self.count.values]
+        if self._open is None:
+            return buckets
+
+        start, minimum, maximum, total, count = self._open
+        open_bucket = [start, minimum, maximum, total / count, count]
+        return [np.concatenate([values, [value]])
+                for values, value in zip(buckets, open_bucket)]
+
+
+class Rollup():
+    """
+    Cascading rollup tiers of a stat at constant memory. Every sample is
+    added to the finest tier, every bucket closed in a tier is added to the
+    next coarser one. `periods` holds the period in seconds and the number
+    of buckets of every tier, so the coarsest tier covers one day.
+    """
+    periods = ((1., 600), (10., 360), (60., 1440))
+
+    def __init__(self, length=None):
+        self.tiers = [RollupTier(period, size, length)
+                      for period, size in self.periods]
+
+    def add(self, value, timestamp):
+        aggregate = (timestamp, value, value, value, 1)
+        for tier in self.tiers:
+            aggregate = tier.add(*aggregate)
+            if aggregate is None:
+                break
+
+    def get_tier(self, span):
+        """
+        Get the finest tier which covers `span` seconds
+        or the coarsest one if no tier does.
+        """
+        for tier in self.tiers:
+            if tier.period * len(tier.count) >= span:
+                return tier
+        return self.tiers[-1]
+
+
+def downsample_buckets(timestamps, minimum, maximum, mean, count,
+                       start, end, n_points):
+    """
+    Merge the buckets between `start` and `end` into at most `n_points`
+    evenly spaced bins. The buckets must be ordered by their timestamps.
+    Returns a dictionary with the time of the first bucket of every bin
+    relative to `end` and the minimum, maximum, mean and count of the bins.
+    """
+    keep = (count > 0) & (timestamps >= start) & (timestamps <= end)
+    timestamps, minimum, maximum, mean, count = \
+        (values[keep] for values in (timestamps, minimum, maximum,
+                                     mean, count))
+
+    bins = ((timestamps - start) / max(end - start, 1e-9) *
+            n_points).astype(int)
+    bins = np.minimum(bins, n_points - 1)
+    # the index of the first bucket of every non-empty bin
+    firsts = np.flatnonzero(np.diff(bins, prepend=-1))
+    if len(firsts) == 0:
+        return {'time': [], 'minimum': [], 'maximum': [], 'mean': [],
+                'count': []}
+
+    # counts have to broadcast against the rows of vector stats
+    row_shape = (-1,) + (1,) * (mean.ndim - 1)
+    bin_count = np.add.reduceat(count, firsts)
+    return {
+        'time': (timestamps[firsts] - end).tolist(),
+        'minimum': np.minimum.reduceat(minimum, firsts).tolist(),
+        'maximum': np.maximum.reduceat(maximum, firsts).tolist(),
+        'mean': (np.add.reduceat(mean * count.reshape(row_shape), firsts) /
+                 bin_count.reshape(row_shape)).tolist(),
+        'count': bin_count.tolist()
+    }
+
+
+def lttb_indices(values, n_points):
+    """
+    Get the indices of `n_points` of the evenly spaced `values` chosen with
+    Largest-Triangle-Three-Buckets downsampling. The first and last point
+    are always kept. The points in between are split into `n_points - 2`
+    buckets, from every bucket the point which forms the largest triangle
+    with the point chosen from the previous bucket and the mean of the
+    next bucket is kept. The triangle areas of every bucket are computed
+    at once with NumPy, only the loop over the buckets is in Python.
+    """
+    n_values = len(values)
+    if n_points >= n_values:
+        return np.arange(n_values)
+    if n_points < 3:
+        return np.array([0, n_values - 1][:n_points], dtype=int)
+
+    values = np.asarray(values, dtype=float)
+    # bucket i spans edges[i]:edges[i + 1], the first and the last point
+    # are not part of any bucket
+    edges = np.linspace(1, n_values - 1, n_points - 1).astype(int)
+    # the mean of every bucket and of the last point as the final bucket
+    means = np.append(np.add.reduceat(values[1:-1], edges[:-1] - 1) /
+                      np.diff(edges), values[-1])
+    mean_x = np.append((edges[:-1] + edges[1:] - 1) / 2, n_values - 1)
+
+    indices = np.empty(n_points, dtype=int)
+    indices[0], indices[-1] = 0, n_values - 1
+    previous = 0
+    for i in range(n_points - 2):
+        x = np.arange(edges[i], edges[i + 1])
+        # twice the area of the triangles, the constant factor does
+        # not change which one is the largest
+        areas = np.abs((previous - mean_x[i + 1]) *
+                       (values[x] - values[previous]) -
+                       (previous - x) *
+                       (means[i + 1] - values[previous]))
+        previous = x[np.argmax(areas)]
+        indices[i + 1] = previous
+    return indices
@@ -17,6 +17,7 @@ REQUIRES_PYTHON = '>=3.6.0'
 
 REQUIRED = [
     'psutil',  # required for measuring RAM, CPU etc
+    'numpy',  # required for the samples and history of vector stats
     'appdirs',  # required to find out user config and data directorires
     'jupyter',  # required to measure ram usage in a jupyter notebook
     'pympler'  # required to measure the size of the variables in the notebook
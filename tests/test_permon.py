@@ -1,4 +1,5 @@
 import sys
+import asyncio
 import pytest
 import warnings
 import permon
@@ -6,8 +7,12 @@ import time
 import random
 import os
 import secrets
-from permon.frontend import native, terminal, browser
-from permon.backend import Stat
+import threading
+from permon.frontend import (native, terminal, browser, record, Scheduler,
+                             FastScheduler)
+from permon.frontend import utils as frontend_utils
+from permon.backend import (Stat, sampling, procfs, watchdog, isolation,
+                            aio, rate, recording, replay)
 from permon import exceptions, backend, config, security
 
 FPS = 10
@@ -30,12 +35,26 @@ def check_if_valid_number(x):
 def test_valid_values(cls):
     instance = cls(fps=FPS)
 
-    if instance.has_contributor_breakdown:
-        stat, _ = instance.get_stat()
-    else:
-        stat = instance.get_stat()
+    instance.start()
+    try:
+        if aio.is_async(instance.get_stat):
+            result = aio.run(instance.get_stat)
+        else:
+            result = instance.get_stat()
+    finally:
+        instance.stop()
+    # the declared output shape must match the actual one
+    assert isinstance(result, tuple) == instance.has_contributor_breakdown
 
-    check_if_valid_number(stat)
+    sample = instance.make_sample(result)
+    if instance.is_vector:
+        assert sample.value.shape == (len(instance.labels),)
+        for value in sample.value:
+            check_if_valid_number(float(value))
+    else:
+        check_if_valid_number(sample.value)
+    for name, value in sample.contributors:
+        check_if_valid_number(value)
 
 
 def test_stats_available():
@@ -60,10 +79,570 @@ def test_minimum_and_maximum_defined(cls):
         check_if_valid_number(x)
 
 
+def test_hub_reads_source_once_per_tick():
+    calls = []
+    hub = sampling.SamplingHub()
+    hub.register_source('test', lambda: calls.append(1) or len(calls))
+
+    with hub.tick():
+        assert hub.get('test') == hub.get('test') == 1
+    assert hub.get('test') == 2
+    assert len(calls) == 2
+
+
+def test_counter_rate_window():
+    counter = rate.CounterRate(window=1.)
+    assert counter.update(100, 0.) == 0.
+    assert counter.update(150, .5) == 100.
+    assert counter.update(200, 1.) == 100.
+    # the reading at 0 s has left the window
+    assert counter.update(400, 1.5) == 250.
+    # a reset counter starts a new window
+    assert counter.update(10, 2.) == 0.
+    assert counter.update(20, 2.5) == 20.
+
+
+@pytest.mark.skipif(not procfs.is_available(), reason='needs /proc')
+def test_procfs_matches_psutil():
+    import psutil
+
+    reader = procfs.ProcReader()
+    assert reader.read_memory()[1] == psutil.virtual_memory().total
+    assert len(reader.read_cpu_percent()) == psutil.cpu_count()
+    for value in reader.read_disk_io():
+        check_if_valid_number(value)
+    reader.close()
+
+    if procfs.is_pss_available():
+        rss = psutil.Process().memory_info().rss
+        # shared pages count only partially towards the PSS
+        assert 0 < procfs.read_pss(os.getpid()) <= rss * 1.1
+
+
+def test_scheduler_skips_missed_ticks():
+    now = [0.]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    scheduler = Scheduler(fps=10, clock=lambda: now[0], sleep=sleep)
+    assert scheduler.wait() == 0.
+    assert scheduler.wait() == pytest.approx(.1)
+    # a tick taking 0.35s misses two deadlines which are skipped
+    now[0] += .35
+    assert scheduler.wait() == pytest.approx(.4)
+    assert scheduler.n_skipped == 2
+    assert scheduler.wait() == pytest.approx(.5)
+    assert now[0] == pytest.approx(.5)
+
+
+def test_terminal_monitor_fills_missed_ticks(mocker):
+    mocker.patch.object(terminal.TerminalMonitor, 'paint')
+    cls = backend.get_stats_from_repr('core.read_speed')
+    app = terminal.TerminalApp([cls], fps=FPS)
+    monitor = terminal.TerminalMonitor(cls, fps=FPS, color=None, app=app,
+                                       resolution=(10, 40))
+    samples = [backend.Sample(1., []), backend.Sample(2., [])]
+    mocker.patch.object(monitor, 'poll', side_effect=samples)
+    try:
+        monitor.update(0.)
+        # the two ticks in between have been skipped
+        monitor.update(3 / FPS)
+        assert monitor.history.values[-4:].tolist() == [1., 1., 1., 2.]
+        assert len(monitor.history) == 10
+    finally:
+        monitor.stop()
+
+
+def test_vector_stat_history(capsys):
+    cls = backend.get_stats_from_repr('core.cpu_usage_per_core')
+    app = terminal.TerminalApp([cls], fps=FPS)
+    monitor = terminal.TerminalMonitor(cls, fps=FPS, color=lambda x: x,
+                                       app=app, resolution=(10, 40))
+    try:
+        monitor.update(0.)
+        monitor.update(2 / FPS)
+    finally:
+        monitor.stop()
+
+    n_elements = len(cls.labels)
+    assert monitor.history.values.shape == (monitor.buffer_size, n_elements)
+    # the skipped tick holds the value of the first update
+    assert (monitor.history.values[-3] == monitor.history.values[-2]).all()
+    # every paint has a title and the 9 remaining rows of the resolution
+    lines = capsys.readouterr().out.split('\n')
+    assert len(lines) == 2 * 10 + 1
+    assert lines[0] == cls.name
+    assert lines[1].strip().startswith(cls.labels[0])
+
+    history = frontend_utils.RingBuffer(3, 2)
+    history.append([1., 2.])
+    history.append([3., 4.], n_missed=1)
+    assert history.values.tolist() == [[1., 2.], [1., 2.], [3., 4.]]
+
+
+def test_ring_buffer():
+    history = frontend_utils.RingBuffer(4, fill=-1.)
+    assert history.values.tolist() == [-1.] * 4
+    for value in range(6):
+        history.append(float(value))
+    assert history.values.tolist() == [2., 3., 4., 5.]
+    # the ordered history is a view into the buffer, not a copy
+    assert history.values.base is history._buffer
+    assert (history.min(), history.max()) == (2., 5.)
+
+    history.append(9., n_missed=10)
+    assert history.values.tolist() == [5., 5., 5., 9.]
+
+
+def test_rollup_tiers():
+    rollup = frontend_utils.Rollup()
+    # one sample every 100ms for 25 seconds, the value is the second
+    for i in range(250):
+        rollup.add(float(i // 10), i / 10)
+
+    fine, coarse = rollup.tiers[0], rollup.tiers[1]
+    starts, minimum, maximum, mean, count = fine.buckets()
+    filled = count > 0
+    # 24 closed buckets and the open one of second 24
+    assert starts[filled].tolist() == [float(i) for i in range(25)]
+    assert count[filled].tolist() == [10] * 25
+    assert mean[filled].tolist() == [float(i) for i in range(25)]
+
+    # the closed buckets of the fine tier have been rolled up
+    starts, minimum, maximum, mean, count = coarse.buckets()
+    filled = count > 0
+    assert starts[filled].tolist() == [0., 10., 20.]
+    assert minimum[filled].tolist() == [0., 10., 20.]
+    assert maximum[filled].tolist() == [9., 19., 23.]
+    assert count[filled].tolist() == [100, 100, 40]
+    assert rollup.get_tier(300.) is fine
+    assert rollup.get_tier(3600.) is coarse
+
+    history = frontend_utils.downsample_buckets(
+        *rollup.tiers[0].buckets(), 5., 24., 2)
+    assert history['minimum'] == [5., 15.]
+    assert history['maximum'] == [14., 24.]
+    assert history['mean'] == [9.5, 19.5]
+    assert history['time'] == [-19., -9.]
+
+
+def test_lttb_keeps_extremes():
+    values = [0.] * 1000
+    values[500] = 10.
+    values[700] = -10.
+    indices = frontend_utils.lttb_indices(values, 20).tolist()
+    assert len(indices) == 20
+    assert indices == sorted(indices)
+    assert indices[0] == 0 and indices[-1] == 999
+    assert 500 in indices and 700 in indices
+
+    assert frontend_utils.lttb_indices(values[:5], 20).tolist() == \
+        [0, 1, 2, 3, 4]
+
+
+def test_recording_roundtrip(tmp_path):
+    path = str(tmp_path / 'session.rec')
+    stats = [
+        {'tag': 'a.scalar', 'repr': 'a.scalar', 'name': 'Scalar',
+         'minimum': 0, 'maximum': None, 'labels': None,
+         'contributors': True},
+        {'tag': 'a.vector', 'repr': 'a.vector', 'name': 'Vector',
+         'minimum': 0, 'maximum': 1, 'labels': ['x', 'y'],
+         'contributors': False}
+    ]
+    # small blocks so that the rows span multiple blocks
+    writer = recording.RecordingWriter(path, stats, fps=10, block_rows=4)
+    for i in range(10):
+        writer.append(1000. + i, [
+            backend.Sample(float(i), [('python', i / 2), ('other', 1.)]),
+            backend.Sample([float(i), -float(i)], [])
+        ])
+
+    # the rows can be read before the writer is closed, as after a crash
+    reader = recording.RecordingReader(path)
+    assert (reader.n_blocks, reader.n_rows) == (3, 10)
+    block = reader.read_block(2)
+    assert block['timestamps'].tolist() == [1008., 1009., 0., 0.]
+    assert block['values'][0][:2].tolist() == [8., 9.]
+    assert block['values'][1][1].tolist() == [9., -9.]
+    assert reader.get_contributors(block, 0, 1) == [('python', 4.5),
+                                                    ('other', 1.)]
+    assert reader.get_contributors(block, 1, 1) == []
+    # every name is only stored once
+    assert reader.names == [None, 'python', 'other']
+
+    writer.close()
+    reader.close()
+    with pytest.raises(FileExistsError):
+        recording.RecordingWriter(path, stats, fps=10)
+
+
+def test_replay_session(tmp_path):
+    path = str(tmp_path / 'session.rec')
+    stats = [{'tag': 'core.cpu_usage', 'repr': 'core.cpu_usage',
+              'name': 'CPU Usage [%]', 'minimum': 0, 'maximum': 100,
+              'labels': None, 'contributors': True}]
+    writer = recording.RecordingWriter(path, stats, fps=1, block_rows=4)
+    for i in range(10):
+        writer.append(1000. + i, [backend.Sample(float(i),
+                                                 [('python', float(i))])])
+    writer.close()
+
+    reader = recording.RecordingReader(path)
+    # the sparse index holds the first timestamp of every block
+    assert reader.index.tolist() == [1000., 1004., 1008.]
+    assert reader.seek(1005.5) == 5
+    assert (reader.seek(0.), reader.seek(2000.)) == (0, 9)
+
+    def play(session, ticks):
+        stat = session.stats[0](fps=1)
+        values = []
+        for tick in ticks:
+            with sampling.hub.tick(tick):
+                values.append(stat.get_stat()[0])
+        return values
+
+    session = replay.ReplaySession(reader, start=2., speed=2.)
+    assert session.stats[0].tag == 'core.cpu_usage'
+    # replayed stats are not available to add in frontends
+    assert session.stats[0] not in backend.get_all_stats()
+    assert play(session, [50., 51., 52., 60.]) == [2., 4., 6., 9.]
+    assert session.finished
+
+    # fast mode plays one row per tick regardless of the time
+    session = replay.ReplaySession(reader, start=7., fast=True)
+    assert play(session, [0., 0., 100., 100.1, 100.2]) == \
+        [7., 7., 8., 9., 9.]
+
+    scheduler = FastScheduler(10, clock=lambda: 5.)
+    deadlines = [scheduler.wait() for _ in range(3)]
+    assert deadlines == pytest.approx([5., 5.1, 5.2])
+
+
+def make_mock_process(mocker, pid):
+    process = mocker.MagicMock(pid=pid)
+    process.name.return_value = 'python3'
+    process.create_time.return_value = 0.
+    process.cpu_percent.return_value = 1.
+    process.memory_info.return_value.rss = 10
+    process.io_counters.return_value = mocker.Mock(read_bytes=0,
+                                                   write_bytes=0)
+    return process
+
+
+def test_process_tracker_contributors(mocker):
+    from permon.backend.stats import core
+
+    processes = [make_mock_process(mocker, pid) for pid in range(200)]
+    # only the first process reads and writes between the first two passes
+    processes[0].io_counters.side_effect = [
+        mocker.Mock(read_bytes=0, write_bytes=0),
+        mocker.Mock(read_bytes=1000, write_bytes=2000),
+        mocker.Mock(read_bytes=1000, write_bytes=2000)
+    ]
+    mocker.patch('psutil.process_iter', return_value=processes)
+    mocker.patch.object(procfs, 'is_pss_available', return_value=True)
+    mocker.patch.object(procfs, 'read_pss', return_value=5)
+    # mocks take much more CPU time than real processes
+    mocker.patch.object(core.ProcessTracker, 'max_cpu_share', 1.)
+
+    tracker = core.ProcessTracker()
+    stop_event = threading.Event()
+    # the first pass does not know the PSS of any process yet
+    assert tracker._scan(stop_event) == {'python3': {
+        'cpu': 200., 'ram': 2000, 'read': 0., 'write': 0.}}
+    values = tracker._scan(stop_event)['python3']
+    # the top processes and one batch read their PSS. all processes use
+    # the same RAM, so the top processes are the first ones of the batch
+    n_pss = tracker.pss_batch
+    assert values['ram'] == n_pss * 5 + (200 - n_pss) * 10
+    # the I/O is the change since the previous pass per second
+    assert values['read'] > 0
+    assert values['write'] == pytest.approx(2 * values['read'])
+
+    tracker._publish(tracker._scan(stop_event))
+    assert tracker.get_contributors('cpu', adapt_to=100.) == [
+        ['other', 0.], ['python3', 100.]]
+    # exited processes are subtracted from the totals of their name
+    tracker._remove_entry((0, 0.))
+    assert tracker._totals['python3']['cpu'] == 199.
+
+    tracker._publish({str(i): {'cpu': i, 'ram': 0, 'read': 0, 'write': 0}
+                      for i in range(10)})
+    assert tracker.get_contributors('cpu', n=3) == [['9', 9], ['8', 8],
+                                                    ['7', 7]]
+    assert tracker.get_contributors('ram') == []
+
+
+def test_process_tracker_skips_denied_processes(mocker):
+    import psutil
+    from permon.backend.stats import core
+
+    processes = [make_mock_process(mocker, pid) for pid in range(5)]
+    for process in processes[1:3]:
+        process.cpu_percent.side_effect = psutil.AccessDenied()
+    mocker.patch('psutil.process_iter', return_value=processes)
+    mocker.patch.object(procfs, 'is_pss_available', return_value=False)
+    mocker.patch.object(core.ProcessTracker, 'max_cpu_share', 1.)
+
+    tracker = core.ProcessTracker()
+    stop_event = threading.Event()
+    # the pass goes on after a denied process
+    assert tracker._scan(stop_event)['python3']['cpu'] == 3.
+    tracker._publish(tracker._scan(stop_event))
+    # denied processes are not read again
+    assert processes[1].cpu_percent.call_count == 1
+    assert tracker.n_denied == 2
+    # the usage the readable processes do not account for is reported
+    assert tracker.get_contributors('cpu', adapt_to=5.) == [
+        ['other', 0.], ['unattributed', 2.], ['python3', 3.]]
+
+
+def test_process_tracker_stops_when_released():
+    from permon.backend.stats import core
+
+    tracker = core.ProcessTracker.acquire()
+    assert core.ProcessTracker.acquire() is tracker
+    core.ProcessTracker.release()
+    assert tracker._thread.is_alive()
+
+    start = time.monotonic()
+    core.ProcessTracker.release()
+    # the scan is woken up instead of being waited for
+    assert time.monotonic() - start < .5
+    assert not tracker._thread.is_alive()
+    assert core.ProcessTracker not in core.ContributorTracker._instances
+
+
+def test_cgroup_reader(tmp_path):
+    from permon.backend import cgroups
+
+    service = tmp_path / 'system.slice' / 'test.service'
+    service.mkdir(parents=True)
+    (tmp_path / 'cgroup.controllers').write_text('cpu memory')
+    (service / 'cpu.stat').write_text('usage_usec 1000000\nuser_usec 0\n')
+    (service / 'memory.current').write_text('4096\n')
+    assert cgroups.is_available(str(tmp_path))
+
+    reader = cgroups.CgroupReader(root=str(tmp_path))
+    name = os.path.join('system.slice', 'test.service')
+    assert reader.read(0.) == {name: {'cpu': 0., 'ram': 4096}}
+    # half a second of CPU time in one second is 50%
+    (service / 'cpu.stat').write_text('usage_usec 1500000\nuser_usec 0\n')
+    assert reader.read(1.) == {name: {'cpu': 50., 'ram': 4096}}
+
+    (service / 'cpu.stat').unlink()
+    (service / 'memory.current').unlink()
+    service.rmdir()
+    assert reader.read(2.) == {}
+    reader.close()
+
+
+def test_process_stat_follows_children():
+    import subprocess
+
+    cls = backend.get_stats_from_repr({
+        'tag': 'process.threads',
+        'settings': {'pid': os.getpid()}
+    })
+    child = subprocess.Popen([sys.executable, '-c',
+                              'import time; time.sleep(10)'])
+    stat = cls(fps=FPS)
+    try:
+        stat.start()
+        n_threads, contributors = stat.get_stat()
+        assert n_threads >= 2
+        names = [name for name, _ in contributors]
+        assert any(name.endswith(f'({child.pid})') for name in names)
+        assert any(name.endswith(f'({os.getpid()})') for name in names)
+
+        from permon.backend.stats import process
+        tree = process.ProcessTree(pattern=r'time\.sleep\(10\)')
+        assert tree.root.pid == child.pid
+    finally:
+        stat.stop()
+        child.kill()
+        child.wait()
+        cls.set_settings(cls.default_settings)
+
+    with pytest.raises(exceptions.StatNotAvailableError):
+        cls.check_availability()
+
+
+@pytest.mark.skipif(not procfs.is_available(), reason='needs /proc')
+def test_thread_reader_measures_busy_thread():
+    from permon.backend.stats import process
+
+    stop = threading.Event()
+
+    def spin():
+        while not stop.is_set():
+            pass
+
+    thread = threading.Thread(target=spin)
+    thread.start()
+    reader = process.ThreadReader(os.getpid())
+    try:
+        reader.read(time.monotonic())
+        time.sleep(.3)
+        threads = reader.read(time.monotonic())
+    finally:
+        stop.set()
+        thread.join()
+        reader.close()
+
+    assert len(threads) >= 2
+    by_tid = {tid: cpu_percent for _, tid, cpu_percent in threads}
+    # the spinning thread has to share the interpreter lock
+    assert by_tid[thread.native_id] > 20
+
+
+def test_sample_interval_holds_value(mocker):
+    cls = backend.get_stats_from_repr({
+        'tag': 'core.read_speed',
+        'sample interval [s]': 1
+    })
+    try:
+        assert cls.sample_interval == 1.
+        assert cls.get_repr()['sample interval [s]'] == 1.
+
+        app = browser.BrowserApp([cls], ['#fff'], port=1234, ip='localhost',
+                                 open_browser=False, fps=FPS)
+        monitor = browser.BrowserMonitor(cls, buffer_size=10, fps=FPS,
+                                         color='#fff', app=app)
+        get_stat = mocker.spy(monitor.stat, 'get_stat')
+        try:
+            for i in range(FPS + 1):
+                monitor.update(i / FPS)
+            assert get_stat.call_count == 2
+            assert len(monitor.history) == 10
+
+            # the downsampled history is cached until the next sample
+            history = monitor.get_json_info(n_points=4)['history']
+            assert len(history) == 4
+            assert monitor.get_downsampled_history(4) is history
+            monitor.update(1 + 2 / FPS)
+            assert monitor.get_downsampled_history(4) is not history
+        finally:
+            monitor.watchdog.stop()
+    finally:
+        cls.set_sample_interval(None)
+    assert cls.get_repr() == cls.tag
+
+
+def test_watchdog_returns_stale_value():
+    class HangingStat():
+        tag = 'test.hanging'
+        deadline = .05
+
+        def __init__(self):
+            self.hang = False
+
+        def get_stat(self):
+            if self.hang:
+                time.sleep(.2)
+            return 1.
+
+    stat = HangingStat()
+    dog = watchdog.Watchdog(stat, max_timeouts=2)
+    assert dog.get_stat(0.) == (1., False)
+
+    stat.hang = True
+    assert dog.get_stat(1.) == (1., True)
+    assert dog.status == watchdog.STALE
+    # the hung call is still running so it counts as another timeout
+    assert dog.get_stat(1.01) == (1., True)
+    assert dog.status == watchdog.BACKING_OFF
+    dog.stop()
+
+    # calls requested together share their deadline
+    stats = [HangingStat() for _ in range(4)]
+    dogs = [watchdog.Watchdog(stat) for stat in stats]
+    for stat in stats:
+        stat.hang = True
+    start = time.monotonic()
+    for dog in dogs:
+        dog.request(0.)
+    for dog in dogs:
+        assert dog.collect() == (None, True)
+        dog.stop()
+    assert time.monotonic() - start < 2 * HangingStat.deadline
+
+
+def test_async_stats_run_concurrently():
+    class SleepingStat():
+        tag = 'test.sleeping'
+        deadline = 1.
+
+        async def get_stat(self):
+            await asyncio.sleep(.1)
+            return 1.
+
+    dogs = [watchdog.Watchdog(SleepingStat()) for _ in range(5)]
+    start = time.monotonic()
+    for dog in dogs:
+        dog.request(0.)
+    for dog in dogs:
+        assert dog.collect() == (1., False)
+        dog.stop()
+    # the stats sleep at the same time instead of one after another
+    assert time.monotonic() - start < .3
+
+
+@pytest.mark.skipif(not isolation.is_available(), reason='needs fork')
+def test_isolated_stat_runs_in_worker_process():
+    cls = backend.get_stats_from_repr({
+        'tag': 'core.cpu_usage',
+        'isolated': True
+    })
+    monitor = None
+    try:
+        assert cls.get_repr()['isolated']
+        app = browser.BrowserApp([cls], ['#fff'], port=1234, ip='localhost',
+                                 open_browser=False, fps=FPS)
+        monitor = browser.BrowserMonitor(cls, buffer_size=10, fps=FPS,
+                                         color='#fff', app=app)
+        assert isinstance(monitor.stat, isolation.ProcessStat)
+        assert monitor.stat.maximum == 100
+
+        monitor.update(0.)
+        check_if_valid_number(monitor.value)
+        for name, value in monitor.contributors:
+            check_if_valid_number(value)
+    finally:
+        if monitor is not None:
+            monitor.stop()
+        cls.set_isolated(None)
+
+    ring = isolation.SharedRing(n_slots=2, slot_size=64)
+    assert ring.read_latest() is None
+    for i in range(5):
+        ring.write([i, None])
+    assert ring.read_latest() == [4, None]
+    with pytest.raises(ValueError):
+        ring.write(['x' * 64])
+    ring.close()
+
+
+@pytest.mark.skipif(not procfs.is_available(), reason='needs /proc')
+def test_procfs_falls_back_to_psutil(mocker):
+    mocker.patch.object(procfs.ProcReader, 'read_memory',
+                        side_effect=OSError('test'))
+    hub = sampling.SamplingHub()
+    sampling.register_procfs_sources(hub)
+
+    used, total = hub.get('memory')
+    check_if_valid_number(used)
+    assert hub._sources['memory'] is sampling._read_memory
+
+
 @pytest.mark.parametrize('app, arguments', [
     (terminal.TerminalApp, ['terminal']),
     (native.NativeApp, ['native']),
     (browser.BrowserApp, ['browser']),
+    # initialize is patched, so the recording is never created
+    (record.RecordApp, ['record', '--output', f'{secrets.token_hex()}.rec']),
 ])
 def test_init(app, arguments, mocker):
     mocker.patch.object(sys, 'argv',  ['permon'] + arguments)